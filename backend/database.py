@@ -40,13 +40,34 @@ engine = create_engine(
 )
 
 
+# Per-connection tuning for file-backed SQLite. WAL lets readers run
+# alongside the writer and fsyncs at checkpoints rather than on every commit.
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=3000",
+)
+
+# In-memory databases (tests) cannot use WAL and have nothing to fsync
+_SQLITE_MEMORY_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+)
+
+
 # Enable foreign key constraints for SQLite
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign key constraints for SQLite connections."""
+    """Enable foreign key constraints and tune journaling for SQLite connections."""
     if "sqlite" in DATABASE_URL:
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # The main database has an empty file name when it lives in memory
+        main_file = cursor.execute("PRAGMA database_list").fetchone()[2]
+        for pragma in _SQLITE_FILE_PRAGMAS if main_file else _SQLITE_MEMORY_PRAGMAS:
+            cursor.execute(pragma)
         cursor.close()
 
 
@@ -5,12 +5,76 @@ This module provides functions to query task execution statistics
 for daily and weekly digest emails.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, case
 
-from models import Task, TaskExecution
+from models import Task, TaskExecution, DailyRollup
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+def _utc_date(ms: int) -> str:
+    """Format a Unix ms timestamp as a DailyRollup date key (UTC)."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def _aggregate_by_task(db: Session, start_ms: int, end_ms: int) -> Dict[str, Dict[str, int]]:
+    """
+    Aggregate executions per task for the window [start_ms, end_ms).
+
+    Whole UTC days inside the window are read from DailyRollup; the partial
+    days at either edge are aggregated from TaskExecution directly, so the
+    result is exact for any window.
+
+    Returns:
+        Dictionary of task_id -> {'failed', 'duration', 'duration_count'}
+    """
+    first_day_ms = -(-start_ms // DAY_MS) * DAY_MS
+    last_day_ms = end_ms // DAY_MS * DAY_MS
+
+    if first_day_ms < last_day_ms:
+        edges = [(start_ms, first_day_ms), (last_day_ms, end_ms)]
+        rollup_rows = db.query(
+            DailyRollup.taskId,
+            func.sum(DailyRollup.failed),
+            func.sum(DailyRollup.totalDuration),
+            func.sum(DailyRollup.durationCount)
+        ).filter(
+            and_(
+                DailyRollup.date >= _utc_date(first_day_ms),
+                DailyRollup.date < _utc_date(last_day_ms)
+            )
+        ).group_by(DailyRollup.taskId).all()
+    else:
+        edges = [(start_ms, end_ms)]
+        rollup_rows = []
+
+    raw_rows = []
+    for lo, hi in edges:
+        if lo >= hi:
+            continue
+        raw_rows += db.query(
+            TaskExecution.taskId,
+            func.sum(case((TaskExecution.status == 'failed', 1), else_=0)),
+            func.sum(func.coalesce(TaskExecution.duration, 0)),
+            func.count(TaskExecution.duration)
+        ).filter(
+            and_(
+                TaskExecution.startedAt >= lo,
+                TaskExecution.startedAt < hi
+            )
+        ).group_by(TaskExecution.taskId).all()
+
+    totals: Dict[str, Dict[str, int]] = {}
+    for task_id, failed, duration, duration_count in [*rollup_rows, *raw_rows]:
+        entry = totals.setdefault(task_id, {'failed': 0, 'duration': 0, 'duration_count': 0})
+        entry['failed'] += int(failed or 0)
+        entry['duration'] += int(duration or 0)
+        entry['duration_count'] += int(duration_count or 0)
+
+    return totals
 
 
 def get_daily_digest_data(db: Session, date: datetime) -> Dict[str, Any]:
@@ -193,47 +257,35 @@ def get_weekly_summary_data(db: Session, week_start: datetime) -> Dict[str, Any]
         )
     ).count()
 
+    # Per-task aggregates (served mostly from DailyRollup)
+    per_task = _aggregate_by_task(db, week_start_ms, week_end_ms)
+
     # Get top 3 tasks with most failures
-    top_failures_query = db.query(
-        Task.id,
-        Task.name,
-        func.count(TaskExecution.id).label('failure_count')
-    ).join(
-        TaskExecution, Task.id == TaskExecution.taskId
-    ).filter(
-        and_(
-            TaskExecution.startedAt >= week_start_ms,
-            TaskExecution.startedAt < week_end_ms,
-            TaskExecution.status == 'failed'
-        )
-    ).group_by(
-        Task.id, Task.name
-    ).order_by(
-        func.count(TaskExecution.id).desc()
-    ).limit(3).all()
+    failing = sorted(
+        ((task_id, agg['failed']) for task_id, agg in per_task.items() if agg['failed'] > 0),
+        key=lambda item: item[1],
+        reverse=True
+    )[:3]
+    task_names = dict(
+        db.query(Task.id, Task.name).filter(Task.id.in_([task_id for task_id, _ in failing])).all()
+    ) if failing else {}
 
     # Format top failures (matching template expectations)
     top_failures = [
         {
-            'task': row.name,
-            'count': row.failure_count
+            'task': task_names[task_id],
+            'count': count
         }
-        for row in top_failures_query
+        for task_id, count in failing
+        if task_id in task_names
     ]
 
     # Calculate average execution duration
-    avg_duration_result = db.query(
-        func.avg(TaskExecution.duration)
-    ).filter(
-        and_(
-            TaskExecution.startedAt >= week_start_ms,
-            TaskExecution.startedAt < week_end_ms,
-            TaskExecution.duration.isnot(None)
-        )
-    ).scalar()
+    total_duration = sum(agg['duration'] for agg in per_task.values())
+    duration_count = sum(agg['duration_count'] for agg in per_task.values())
 
-    # Handle None result (no executions with duration)
-    avg_duration_ms = int(avg_duration_result) if avg_duration_result else 0
+    # Handle no executions with duration
+    avg_duration_ms = int(total_duration / duration_count) if duration_count else 0
 
     return {
         'total_executions': total_executions,
@@ -267,33 +319,20 @@ def get_execution_trends(db: Session, days: int = 7) -> List[Dict[str, Any]]:
     # Calculate date range (last N days including today)
     end_date = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
     start_date = (end_date - timedelta(days=days-1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    start_date_ms = int(start_date.timestamp() * 1000)
-    end_date_ms = int(end_date.timestamp() * 1000)
 
-    # Query executions grouped by date
-    # Convert startedAt (Unix ms) to date string for grouping
+    # Read per-day counts from the DailyRollup table (one row per day and task)
     query_result = db.query(
-        func.date(func.datetime(TaskExecution.startedAt / 1000, 'unixepoch')).label('execution_date'),
-        func.sum(
-            case(
-                (TaskExecution.status == 'completed', 1),
-                else_=0
-            )
-        ).label('successful'),
-        func.sum(
-            case(
-                (TaskExecution.status == 'failed', 1),
-                else_=0
-            )
-        ).label('failed'),
-        func.count(TaskExecution.id).label('total')
+        DailyRollup.date.label('execution_date'),
+        func.sum(DailyRollup.successful).label('successful'),
+        func.sum(DailyRollup.failed).label('failed'),
+        func.sum(DailyRollup.total).label('total')
     ).filter(
         and_(
-            TaskExecution.startedAt >= start_date_ms,
-            TaskExecution.startedAt <= end_date_ms
+            DailyRollup.date >= start_date.strftime('%Y-%m-%d'),
+            DailyRollup.date <= end_date.strftime('%Y-%m-%d')
         )
     ).group_by(
-        func.date(func.datetime(TaskExecution.startedAt / 1000, 'unixepoch'))
+        DailyRollup.date
     ).all()
 
     # Create a dictionary of date -> counts for easy lookup
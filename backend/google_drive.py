@@ -6,24 +6,34 @@ Integrates with ActivityLog for audit trail.
 
 Features:
 - OAuth 2.0 authentication using user credentials
-- Automatic log archival (files older than 30 days)
+- Automatic log archival (files older than 30 days), gzip-compressed
 - Organized folder structure: AI Assistant Drive/logs/YYYY/MM/
 - File upload/download utilities
 - Drive link generation for task outputs
 """
 
 import os
+import re
+import gzip
 import json
+import shutil
 import logging
 import mimetypes
+import functools
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+import httplib2
+from googleapiclient.http import HttpRequest, MediaFileUpload, MediaIoBaseDownload
 from googleapiclient.errors import HttpError
 
 from logger import get_logger
@@ -32,11 +42,87 @@ from logger import get_logger
 logger = get_logger()
 
 
+@functools.lru_cache(maxsize=64)
+def _mime_for(extension: str) -> str:
+    """Get the MIME type for a file extension, defaulting to octet-stream."""
+    mime_type, _ = mimetypes.guess_type(f'file{extension}')
+    return mime_type or 'application/octet-stream'
+
+
+# Rotated log files are named ai_assistant.log.YYYY-MM-DD
+_ROTATED_LOG_RE = re.compile(r'^ai_assistant\.log\.(\d{4})-(\d{2})-(\d{2})$')
+
+
+def _rotated_log_date(filename: str) -> Optional[datetime]:
+    """Get the date a rotated log file covers from its name.
+
+    Args:
+        filename: Log file name (e.g., 'ai_assistant.log.2026-01-15')
+
+    Returns:
+        Midnight UTC of the date in the name, or None if it has no valid date
+    """
+    match = _ROTATED_LOG_RE.match(filename)
+    if not match:
+        return None
+
+    try:
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
 class DriveError(Exception):
     """Raised when Google Drive operations fail."""
     pass
 
 
+# Credentials already loaded from disk, keyed by credentials file path
+_credentials_cache: Dict[str, Credentials] = {}
+_credentials_lock = threading.Lock()
+
+
+def _load_credentials(credentials_file: str, scopes: List[str]) -> Credentials:
+    """Load OAuth credentials, reusing the in-memory copy when still valid.
+
+    The file is read once per path. Expired credentials are refreshed and
+    written back atomically, so the file is never left half-written.
+
+    Args:
+        credentials_file: Path to OAuth credentials file
+        scopes: OAuth scopes to request
+
+    Returns:
+        Valid credentials
+
+    Raises:
+        DriveError: If credentials are invalid and cannot be refreshed
+    """
+    with _credentials_lock:
+        creds = _credentials_cache.get(credentials_file)
+        if creds is None:
+            # Load credentials from file
+            creds = Credentials.from_authorized_user_file(credentials_file, scopes)
+
+        # Refresh token if expired
+        if not creds.valid:
+            if creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                # Save refreshed credentials
+                temp_file = f"{credentials_file}.tmp"
+                with open(temp_file, 'w') as token:
+                    token.write(creds.to_json())
+                os.replace(temp_file, credentials_file)
+            else:
+                _credentials_cache.pop(credentials_file, None)
+                raise DriveError(
+                    "Invalid credentials. Please run google_auth_setup.py to re-authenticate."
+                )
+
+        _credentials_cache[credentials_file] = creds
+        return creds
+
+
 class DriveConfig:
     """Configuration for Google Drive client.
 
@@ -75,6 +161,18 @@ class DriveClient:
 
     SCOPES = ['https://www.googleapis.com/auth/drive']
 
+    # Drive rejects batch requests with more than 100 calls; smaller batches
+    # stay under the per-user write quota
+    BATCH_SIZE = 25
+
+    # Resumable upload chunk size (must be a multiple of 256 KiB)
+    UPLOAD_CHUNK_SIZE = 2 * 1024 * 1024
+
+    # Bytes fetched per ranged GET when downloading, and the local file
+    # write buffer they are written through
+    DOWNLOAD_CHUNK_SIZE = 2 * 1024 * 1024
+    DOWNLOAD_BUFFER_SIZE = 64 * 1024
+
     def __init__(self, credentials_file: str = 'google_user_credentials.json'):
         """Initialize Drive client with OAuth credentials.
 
@@ -85,6 +183,11 @@ class DriveClient:
             DriveError: If authentication fails
         """
         config = DriveConfig(credentials_file)
+        self._credentials = None
+        self._local = threading.local()
+        self._folder_lock = threading.Lock()
+        # Folder IDs already resolved, keyed by (parent_id, folder_name)
+        self._folder_cache: Dict[Tuple[Optional[str], str], str] = {}
         self.service = self._authenticate(config.credentials_file)
 
     def _authenticate(self, credentials_file: str):
@@ -100,26 +203,17 @@ class DriveClient:
             DriveError: If authentication fails
         """
         try:
-            # Load credentials from file
-            creds = Credentials.from_authorized_user_file(
-                credentials_file,
-                self.SCOPES
-            )
-
-            # Refresh token if expired
-            if not creds.valid:
-                if creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                    # Save refreshed credentials
-                    with open(credentials_file, 'w') as token:
-                        token.write(creds.to_json())
-                else:
-                    raise DriveError(
-                        "Invalid credentials. Please run google_auth_setup.py to re-authenticate."
-                    )
+            creds = _load_credentials(credentials_file, self.SCOPES)
 
             # Build Drive API service
-            service = build('drive', 'v3', credentials=creds)
+            self._credentials = creds
+            service = build(
+                'drive',
+                'v3',
+                credentials=creds,
+                cache_discovery=False,
+                requestBuilder=self._build_request
+            )
             logger.info("Google Drive client initialized successfully")
             return service
 
@@ -127,6 +221,29 @@ class DriveClient:
             logger.error(f"Failed to authenticate with Google Drive: {e}")
             raise DriveError(f"Authentication failed: {e}")
 
+    def _thread_http(self) -> AuthorizedHttp:
+        """Get an authorized HTTP connection owned by the calling thread.
+
+        httplib2 connections are not thread-safe, and one client is shared
+        by every thread (see _get_client), so each thread gets its own.
+
+        Returns:
+            Authorized HTTP connection for the current thread
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _build_request(self, http, *args, **kwargs) -> HttpRequest:
+        """Build an API request that runs on the calling thread's connection.
+
+        Passed to build() as requestBuilder, so every request made through
+        self.service uses _thread_http() instead of the shared connection.
+        """
+        return HttpRequest(self._thread_http(), *args, **kwargs)
+
     def _find_or_create_folder(
         self,
         folder_name: str,
@@ -144,6 +261,10 @@ class DriveClient:
         Raises:
             DriveError: If folder operation fails
         """
+        cached_id = self._folder_cache.get((parent_id, folder_name))
+        if cached_id:
+            return cached_id
+
         try:
             # Search for existing folder
             query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
@@ -161,56 +282,148 @@ class DriveClient:
             # Return existing folder if found
             if files:
                 folder_id = files[0]['id']
+                self._folder_cache[(parent_id, folder_name)] = folder_id
                 logger.info(f"Found existing folder: {folder_name} (ID: {folder_id})")
                 return folder_id
 
-            # Create new folder
-            folder_metadata = {
-                'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder'
-            }
-            if parent_id:
-                folder_metadata['parents'] = [parent_id]
-
-            folder = self.service.files().create(
-                body=folder_metadata,
-                fields='id'
-            ).execute()
-
-            folder_id = folder['id']
-            logger.info(f"Created new folder: {folder_name} (ID: {folder_id})")
-            return folder_id
+            return self._create_folder(folder_name, parent_id)
 
         except HttpError as e:
             logger.error(f"Failed to find or create folder '{folder_name}': {e}")
             raise DriveError(f"Folder operation failed: {e}")
 
-    def _create_folder_path(self, folder_path: str) -> str:
+    def _create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
+        """Create a new folder without searching for an existing one.
+
+        Args:
+            folder_name: Name of the folder
+            parent_id: Parent folder ID (None for root)
+
+        Returns:
+            Folder ID
+
+        Raises:
+            HttpError: If the create request fails
+        """
+        folder_metadata = {
+            'name': folder_name,
+            'mimeType': 'application/vnd.google-apps.folder'
+        }
+        if parent_id:
+            folder_metadata['parents'] = [parent_id]
+
+        folder = self.service.files().create(
+            body=folder_metadata,
+            fields='id'
+        ).execute()
+
+        folder_id = folder['id']
+        self._folder_cache[(parent_id, folder_name)] = folder_id
+        logger.info(f"Created new folder: {folder_name} (ID: {folder_id})")
+        return folder_id
+
+    def _create_folder_path(self, folder_path: str) -> Optional[str]:
         """Create nested folder structure from path.
 
+        Paths already resolved by this client are answered from its folder
+        cache. Otherwise all segments are looked up with a single files.list
+        request and the parent chain is resolved in memory; only the missing
+        tail is created.
+
         Args:
             folder_path: Folder path (e.g., 'AI Assistant Drive/logs/2026/02')
 
         Returns:
-            Final folder ID
+            Final folder ID, or None if the path has no segments
 
         Raises:
             DriveError: If folder creation fails
         """
-        parts = folder_path.split('/')
-        parent_id = None
+        parts = [part for part in folder_path.split('/') if part]  # Skip empty parts
+        if not parts:
+            return None
 
+        parent_id = None
         for part in parts:
-            if part:  # Skip empty parts
-                parent_id = self._find_or_create_folder(part, parent_id)
+            parent_id = self._folder_cache.get((parent_id, part))
+            if parent_id is None:
+                break
+        else:
+            return parent_id
+
+        try:
+            # Drive queries have no `name in (...)`, so OR the names together
+            name_clauses = ' or '.join(f"name='{part}'" for part in dict.fromkeys(parts))
+            folders_by_name: Dict[str, List[Dict[str, Any]]] = {}
+            page_token = None
+
+            # Read every page so an existing folder is never taken for missing
+            while True:
+                request_params = {
+                    'q': f"mimeType='application/vnd.google-apps.folder' and ({name_clauses}) and trashed=false",
+                    'spaces': 'drive',
+                    'fields': 'nextPageToken, files(id, name, parents)',
+                    'pageSize': 1000,
+                }
+                if page_token:
+                    request_params['pageToken'] = page_token
+
+                results = self.service.files().list(**request_params).execute()
+                for folder in results.get('files', []):
+                    folders_by_name.setdefault(folder['name'], []).append(folder)
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
+            parent_id = None
+            for index, part in enumerate(parts):
+                match = next(
+                    (
+                        folder for folder in folders_by_name.get(part, [])
+                        if parent_id is None or parent_id in folder.get('parents', [])
+                    ),
+                    None
+                )
+                if match is None:
+                    # Everything below a missing folder is missing too
+                    for missing in parts[index:]:
+                        parent_id = self._create_folder(missing, parent_id)
+                    return parent_id
+
+                self._folder_cache[(parent_id, part)] = match['id']
+                parent_id = match['id']
+
+            return parent_id
+
+        except HttpError as e:
+            logger.error(f"Failed to create folder path '{folder_path}': {e}")
+            raise DriveError(f"Folder operation failed: {e}")
+
+    def get_folder_id(self, folder_path: str) -> Optional[str]:
+        """Get the ID of a folder path, creating missing folders.
+
+        Serialized so concurrent callers resolving the same new folder
+        don't each create a copy of it.
 
-        return parent_id
+        Args:
+            folder_path: Folder path (e.g., 'AI Assistant Drive/logs/2026/02')
+
+        Returns:
+            Final folder ID, or None if the path has no segments
+
+        Raises:
+            DriveError: If folder creation fails
+        """
+        with self._folder_lock:
+            return self._create_folder_path(folder_path)
 
     def upload_file(
         self,
         file_path: str,
         folder_path: Optional[str] = None,
-        mime_type: Optional[str] = None
+        mime_type: Optional[str] = None,
+        folder_id: Optional[str] = None
     ) -> str:
         """Upload a file to Google Drive.
 
@@ -218,6 +431,7 @@ class DriveClient:
             file_path: Local file path to upload
             folder_path: Destination folder path in Drive (e.g., 'AI Assistant Drive/logs/2026/02')
             mime_type: MIME type (auto-detected if None)
+            folder_id: Destination folder ID; skips resolving folder_path when given
 
         Returns:
             File ID of uploaded file
@@ -234,33 +448,43 @@ class DriveClient:
 
             # Detect MIME type if not provided
             if not mime_type:
-                mime_type, _ = mimetypes.guess_type(file_path)
-                if not mime_type:
-                    mime_type = 'application/octet-stream'
+                mime_type = _mime_for(os.path.splitext(file_path)[1])
 
             # Create folder structure if specified
-            parent_id = None
-            if folder_path:
-                parent_id = self._create_folder_path(folder_path)
+            parent_id = folder_id
+            if parent_id is None and folder_path:
+                parent_id = self.get_folder_id(folder_path)
 
             # Prepare file metadata
             file_metadata = {'name': file_name}
             if parent_id:
                 file_metadata['parents'] = [parent_id]
 
-            # Upload file
-            media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
-            file = self.service.files().create(
+            # Upload file in resumable chunks; the thread's connection is
+            # kept alive between chunks and uploads
+            media = MediaFileUpload(
+                file_path,
+                mimetype=mime_type,
+                chunksize=self.UPLOAD_CHUNK_SIZE,
+                resumable=True
+            )
+            request = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id, webViewLink'
-            ).execute()
+            )
+            file = None
+            while file is None:
+                _, file = request.next_chunk(num_retries=3)
 
             file_id = file['id']
             logger.info(f"Uploaded file: {file_name} (ID: {file_id})")
             return file_id
 
         except HttpError as e:
+            if e.resp.status == 404:
+                # A cached parent folder may have been deleted in Drive
+                self._folder_cache.clear()
             logger.error(f"Failed to upload file '{file_path}': {e}")
             raise DriveError(f"Upload failed: {e}")
 
@@ -277,11 +501,11 @@ class DriveClient:
         try:
             request = self.service.files().get_media(fileId=file_id)
 
-            with open(destination_path, 'wb') as f:
-                downloader = MediaIoBaseDownload(f, request)
+            with open(destination_path, 'wb', buffering=self.DOWNLOAD_BUFFER_SIZE) as f:
+                downloader = MediaIoBaseDownload(f, request, chunksize=self.DOWNLOAD_CHUNK_SIZE)
                 done = False
                 while not done:
-                    status, done = downloader.next_chunk()
+                    status, done = downloader.next_chunk(num_retries=3)
 
             logger.info(f"Downloaded file: {file_id} to {destination_path}")
 
@@ -333,11 +557,75 @@ class DriveClient:
             logger.error(f"Failed to get link for file '{file_id}': {e}")
             raise DriveError(f"Failed to get file link: {e}")
 
+    def get_file_links(self, file_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Get web view links for many files using batched metadata requests.
+
+        Requests are grouped into Drive batch calls of at most BATCH_SIZE
+        files, so N lookups cost ceil(N / BATCH_SIZE) round-trips.
+
+        Args:
+            file_ids: Drive file IDs
+
+        Returns:
+            Dict mapping each file ID to its web view link (None if the
+            lookup for that file failed)
+
+        Raises:
+            DriveError: If a batch request fails
+        """
+        links: Dict[str, Optional[str]] = {}
+
+        def _on_done(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to get link for file '{request_id}': {exception}")
+                links[request_id] = None
+            else:
+                links[request_id] = response.get('webViewLink')
+
+        try:
+            for start in range(0, len(file_ids), self.BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=_on_done)
+                for file_id in file_ids[start:start + self.BATCH_SIZE]:
+                    batch.add(
+                        self.service.files().get(fileId=file_id, fields='webViewLink'),
+                        request_id=file_id
+                    )
+                batch.execute()
+
+        except HttpError as e:
+            logger.error(f"Failed to get links for {len(file_ids)} files: {e}")
+            raise DriveError(f"Failed to get file links: {e}")
+
+        logger.info(f"Retrieved links for {len(file_ids)} files")
+        return links
+
 
 # ============================================================================
 # Public API Functions
 # ============================================================================
 
+# Shared client; authenticating and building the service is expensive
+_client: Optional[DriveClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> DriveClient:
+    """Get the shared DriveClient, creating it on first use.
+
+    Returns:
+        DriveClient shared by the public API functions
+
+    Raises:
+        DriveError: If authentication fails
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DriveClient()
+    return _client
+
+
 def upload_file(
     file_path: str,
     folder_path: Optional[str] = None,
@@ -362,7 +650,7 @@ def upload_file(
     if not os.path.exists(file_path):
         raise DriveError(f"File not found: {file_path}")
 
-    client = DriveClient()
+    client = _get_client()
     return client.upload_file(file_path, folder_path, mime_type)
 
 
@@ -379,7 +667,7 @@ def download_file(file_id: str, destination_path: str) -> None:
     Example:
         >>> download_file('abc123', '/path/to/save/file.json')
     """
-    client = DriveClient()
+    client = _get_client()
     client.download_file(file_id, destination_path)
 
 
@@ -400,22 +688,57 @@ def get_drive_link(file_id: str, make_public: bool = False) -> str:
         >>> link = get_drive_link('abc123', make_public=True)
         >>> print(f"View file: {link}")
     """
-    client = DriveClient()
+    client = _get_client()
     return client.get_file_link(file_id, make_public)
 
 
+def _compress_log(source_path: str, destination_path: str) -> None:
+    """Gzip a log file.
+
+    Args:
+        source_path: Log file to compress
+        destination_path: Path of the .gz file to write
+    """
+    with open(source_path, 'rb') as source, gzip.open(destination_path, 'wb', compresslevel=6) as destination:
+        shutil.copyfileobj(source, destination, 1024 * 1024)
+
+
+def _upload_compressed_log(client: DriveClient, file_path: str, folder_id: str) -> str:
+    """Gzip a log file into a temporary directory and upload the result.
+
+    Args:
+        client: Drive client to upload with
+        file_path: Log file to archive
+        folder_id: Destination folder ID
+
+    Returns:
+        File ID of the uploaded .gz file
+
+    Raises:
+        DriveError: If upload fails
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        compressed_path = os.path.join(temp_dir, f"{os.path.basename(file_path)}.gz")
+        _compress_log(file_path, compressed_path)
+        return client.upload_file(compressed_path, mime_type='application/gzip', folder_id=folder_id)
+
+
 def archive_old_logs(
     log_dir: Optional[str] = None,
-    days_threshold: int = 30
+    days_threshold: int = 30,
+    max_workers: int = 2
 ) -> List[Dict[str, Any]]:
     """Archive log files older than threshold to Google Drive.
 
     Moves log files older than days_threshold to Google Drive organized by
-    year and month. Deletes local files after successful upload.
+    year and month. Each file is gzip-compressed before upload (JSON logs
+    shrink roughly tenfold) and stored as <filename>.gz. Deletes local files
+    after successful upload.
 
     Args:
         log_dir: Directory containing log files (defaults to ai-workspace/logs)
         days_threshold: Age threshold in days (default: 30)
+        max_workers: Number of uploads to run concurrently (default: 2)
 
     Returns:
         List of archived file information dicts with keys:
@@ -441,64 +764,103 @@ def archive_old_logs(
     if not os.path.exists(log_dir):
         raise DriveError(f"Log directory not found: {log_dir}")
 
-    client = DriveClient()
+    client = _get_client()
     archived_files = []
+    # Files to upload, grouped by the (year, month) folder they belong in
+    pending: Dict[Tuple[int, int], List[Tuple[str, str]]] = defaultdict(list)
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_threshold)
 
-    logger.info(f"Starting log archival from {log_dir} (threshold: {days_threshold} days)")
-
-    # Scan log directory for old files
-    for filename in os.listdir(log_dir):
-        file_path = os.path.join(log_dir, filename)
-
-        # Skip directories and current log file
-        if not os.path.isfile(file_path) or filename.endswith('.log'):
-            continue
-
-        # Check if file is a rotated log file
-        if not filename.startswith('ai_assistant.log.'):
-            continue
-
-        # Check file age
-        file_mtime = datetime.fromtimestamp(
-            os.path.getmtime(file_path),
-            tz=timezone.utc
-        )
+    # Loop-invariant bounds: file name dates outside them settle the age, and
+    # stat()ed files are compared as raw timestamps
+    clearly_old = cutoff_date - timedelta(days=2)
+    clearly_recent = cutoff_date + timedelta(days=1)
+    cutoff_timestamp = cutoff_date.timestamp()
 
-        if file_mtime > cutoff_date:
-            logger.info(f"Skipping recent file: {filename} (modified: {file_mtime.date()})")
-            continue
+    logger.info(f"Starting log archival from {log_dir} (threshold: {days_threshold} days)")
 
+    # Scan log directory for rotated log files; DirEntry caches its stat()
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+
+            # Skip directories, the current log file and unrelated files
+            if (
+                not filename.startswith('ai_assistant.log.')
+                or filename.endswith('.log')
+                or not entry.is_file()
+            ):
+                continue
+
+            # The date in the file name settles the age without a stat()
+            # unless it falls near the cutoff (rotation uses local time)
+            file_date = _rotated_log_date(filename)
+            if file_date is not None and file_date <= clearly_old:
+                pass
+            elif file_date is not None and file_date >= clearly_recent:
+                logger.info(f"Skipping recent file: {filename}")
+                continue
+            else:
+                # Check file age
+                mtime = entry.stat().st_mtime
+
+                if mtime > cutoff_timestamp:
+                    file_mtime = datetime.fromtimestamp(mtime, tz=timezone.utc)
+                    logger.info(f"Skipping recent file: {filename} (modified: {file_mtime.date()})")
+                    continue
+
+            if file_date is None:
+                logger.error(f"Failed to archive {filename}: no YYYY-MM-DD date in file name")
+                continue
+
+            pending[(file_date.year, file_date.month)].append((filename, entry.path))
+
+    # Upload files concurrently; each upload is mostly waiting on the network
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for (year, month), files in sorted(pending.items()):
+            # Resolve AI Assistant Drive/logs/YYYY/MM once for all of its files
+            folder_path = f"AI Assistant Drive/logs/{year}/{month:02d}"
+            try:
+                folder_id = client.get_folder_id(folder_path)
+            except Exception as e:
+                logger.error(f"Failed to archive {len(files)} files to {folder_path}: {e}")
+                continue
+
+            for filename, file_path in files:
+                logger.info(f"Archiving {filename} to {folder_path}")
+                future = executor.submit(_upload_compressed_log, client, file_path, folder_id)
+                futures[future] = (filename, file_path)
+
+        for future in as_completed(futures):
+            filename, file_path = futures[future]
+            try:
+                file_id = future.result()
+
+                # Record archived file; links are fetched in batches afterwards
+                archived_files.append({
+                    'filename': filename,
+                    'file_id': file_id,
+                    'link': None,
+                    'archived_at': datetime.now(timezone.utc).isoformat()
+                })
+
+                # Delete local file after successful upload
+                os.remove(file_path)
+                logger.info(f"Deleted local file: {filename}")
+
+            except Exception as e:
+                logger.error(f"Failed to archive {filename}: {e}")
+                # Continue with other files even if one fails
+
+    # Get shareable links for every uploaded file in batched requests
+    if archived_files:
         try:
-            # Extract date from filename (format: ai_assistant.log.YYYY-MM-DD)
-            date_part = filename.replace('ai_assistant.log.', '')
-            file_date = datetime.strptime(date_part, '%Y-%m-%d')
-
-            # Create folder path: AI Assistant Drive/logs/YYYY/MM
-            folder_path = f"AI Assistant Drive/logs/{file_date.year}/{file_date.month:02d}"
-
-            # Upload file to Drive
-            logger.info(f"Archiving {filename} to {folder_path}")
-            file_id = client.upload_file(file_path, folder_path)
-
-            # Get shareable link
-            link = client.get_file_link(file_id, make_public=False)
-
-            # Record archived file
-            archived_files.append({
-                'filename': filename,
-                'file_id': file_id,
-                'link': link,
-                'archived_at': datetime.now(timezone.utc).isoformat()
-            })
-
-            # Delete local file after successful upload
-            os.remove(file_path)
-            logger.info(f"Deleted local file: {filename}")
-
-        except Exception as e:
-            logger.error(f"Failed to archive {filename}: {e}")
-            # Continue with other files even if one fails
+            links = client.get_file_links([info['file_id'] for info in archived_files])
+            for info in archived_files:
+                info['link'] = links.get(info['file_id'])
+        except DriveError as e:
+            # Files are already uploaded and removed locally; only links are missing
+            logger.error(f"Failed to get links for archived files: {e}")
 
     logger.info(f"Log archival complete. Archived {len(archived_files)} files.")
     return archived_files
@@ -7,11 +7,13 @@ Main application with WebSocket support for real-time communication.
 import json
 import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 import pytz
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -20,6 +22,7 @@ load_dotenv()
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException, Request, BackgroundTasks, Depends
 from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
 from pydantic import BaseModel, Field
 
 from sqlalchemy import text
@@ -69,9 +72,39 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+
+class CachedPreflightCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that builds each distinct preflight response only once.
+
+    A preflight answer depends only on the origin, the requested method,
+    headers and private-network flag, so responses are cached on that key
+    and replayed instead of re-running the allow-list checks.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_preflight = lru_cache(maxsize=64)(self._build_preflight)
+
+    def preflight_response(self, request_headers: Headers):
+        return self._cached_preflight(
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+            request_headers.get("access-control-request-private-network"),
+        )
+
+    def _build_preflight(self, origin, method, requested_headers, private_network):
+        headers = {"origin": origin, "access-control-request-method": method}
+        if requested_headers is not None:
+            headers["access-control-request-headers"] = requested_headers
+        if private_network is not None:
+            headers["access-control-request-private-network"] = private_network
+        return super().preflight_response(Headers(headers))
+
+
 # Configure CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    CachedPreflightCORSMiddleware,
     allow_origins=[
         "http://localhost:3000",  # Next.js dev server
         "http://127.0.0.1:3000",
@@ -132,12 +165,13 @@ class ManualExecuteRequest(BaseModel):
 @app.get("/")
 async def root():
     """Root endpoint - API information."""
-    return {
+    payload = {
         "message": "AI Assistant Backend API",
         "version": "0.1.0",
         "websocket": "/ws",
         "docs": "/docs"
     }
+    return Response(content=orjson.dumps(payload), media_type="application/json")
 
 
 @app.get("/health")
@@ -157,13 +191,15 @@ async def health():
     # Return degraded status if database is not connected
     status = "healthy" if db_status == "connected" and scheduler_status == "running" else "degraded"
 
-    return {
+    # Pre-serialize the payload to skip FastAPI's jsonable_encoder pass
+    payload = {
         "status": status,
         "service": "ai-assistant-backend",
         "database": db_status,
         "scheduler": scheduler_status,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
+    return Response(content=orjson.dumps(payload), media_type="application/json")
 
 
 def get_db():
@@ -277,8 +313,8 @@ async def get_logs(limit: int = Query(default=100, ge=1, le=1000)):
 
     try:
         if log_file_path.exists():
-            # Read log file
-            with open(log_file_path, 'r', encoding='utf-8') as f:
+            # Read log file as bytes; orjson parses UTF-8 directly
+            with open(log_file_path, 'rb') as f:
                 lines = f.readlines()
 
             # Parse JSON log entries (most recent first)
@@ -291,9 +327,9 @@ async def get_logs(limit: int = Query(default=100, ge=1, le=1000)):
                     continue
 
                 try:
-                    log_entry = json.loads(line)
+                    log_entry = orjson.loads(line)
                     logs.append(log_entry)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     # Skip invalid JSON lines
                     continue
 
@@ -303,7 +339,8 @@ async def get_logs(limit: int = Query(default=100, ge=1, le=1000)):
             extra={"metadata": {"error": str(e), "log_file": str(log_file_path)}}
         )
 
-    return {"logs": logs}
+    # Serialize the (potentially large) entry list with orjson directly
+    return Response(content=orjson.dumps({"logs": logs}), media_type="application/json")
 
 
 @app.post("/api/scheduler/sync")
@@ -759,7 +796,10 @@ async def sync_task_to_calendar(request: Request):
         # Only sync enabled tasks to calendar
         if not task.enabled:
             logger.info(f"Skipping calendar sync for disabled task {task_id}")
-            return {"event_id": None, "skipped": True, "reason": "Task disabled"}
+            return Response(
+                content=orjson.dumps({"event_id": None, "skipped": True, "reason": "Task disabled"}),
+                media_type="application/json"
+            )
 
         # Sync to Calendar
         calendar_sync = get_calendar_sync()
@@ -770,7 +810,7 @@ async def sync_task_to_calendar(request: Request):
 
         logger.info(f"Successfully synced task {task_id} to calendar event {event_id}")
 
-        return {"event_id": event_id}
+        return Response(content=orjson.dumps({"event_id": event_id}), media_type="application/json")
 
     except Exception as e:
         logger.error(
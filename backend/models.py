@@ -15,7 +15,7 @@ import uuid
 import json
 
 from sqlalchemy import (
-    Column, String, DateTime, Boolean, Integer, BigInteger, ForeignKey, Text
+    Column, String, DateTime, Boolean, Integer, BigInteger, ForeignKey, Text, Index, event
 )
 from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
@@ -190,6 +190,11 @@ class TaskExecution(Base):
     task = relationship("Task", back_populates="executions")
     logs = relationship("ActivityLog", back_populates="execution", cascade="all, delete-orphan")
 
+    # Digest queries filter on a startedAt range plus status
+    __table_args__ = (
+        Index("ix_taskexec_started_status", "startedAt", "status"),
+    )
+
 
 class ActivityLog(Base):
     """ActivityLog model - mirrors Prisma ActivityLog model.
@@ -251,6 +256,110 @@ class DigestSettings(Base):
     updatedAt = Column(BigInteger, nullable=False, default=lambda: int(time.time() * 1000), onupdate=lambda: int(time.time() * 1000))
 
 
+class DailyRollup(Base):
+    """DailyRollup model - mirrors Prisma DailyRollup model.
+
+    Per-day, per-task TaskExecution aggregates used by the digest and trend
+    queries. Rows are maintained by SQLite triggers on TaskExecution (see
+    below), so they stay current for every writer (backend ORM, Core inserts
+    and the Prisma frontend). Days are UTC calendar days of startedAt.
+    """
+    __tablename__ = "DailyRollup"
+
+    date = Column(String, primary_key=True)  # "YYYY-MM-DD" (UTC)
+    taskId = Column(String, primary_key=True)
+    successful = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    totalDuration = Column(BigInteger, nullable=False, default=0)  # Milliseconds
+    durationCount = Column(Integer, nullable=False, default=0)  # Executions with a duration
+    total = Column(Integer, nullable=False, default=0)
+
+
+def _rollup_day(row: str) -> str:
+    return f"date({row}.startedAt / 1000, 'unixepoch')"
+
+
+def _rollup_add(row: str) -> str:
+    """Upsert the contribution of a NEW/OLD TaskExecution row into DailyRollup."""
+    return f"""
+    INSERT INTO "DailyRollup" (date, taskId, successful, failed, totalDuration, durationCount, total)
+    SELECT {_rollup_day(row)}, {row}.taskId,
+           {row}.status = 'completed', {row}.status = 'failed',
+           COALESCE({row}.duration, 0), {row}.duration IS NOT NULL, 1
+    WHERE typeof({row}.startedAt) = 'integer'
+    ON CONFLICT (date, taskId) DO UPDATE SET
+        successful = successful + excluded.successful,
+        failed = failed + excluded.failed,
+        totalDuration = totalDuration + excluded.totalDuration,
+        durationCount = durationCount + excluded.durationCount,
+        total = total + excluded.total;
+    """
+
+
+def _rollup_remove(row: str) -> str:
+    """Subtract the contribution of a NEW/OLD TaskExecution row from DailyRollup."""
+    match = (
+        f"typeof({row}.startedAt) = 'integer' "
+        f"AND date = {_rollup_day(row)} AND taskId = {row}.taskId"
+    )
+    return f"""
+    UPDATE "DailyRollup" SET
+        successful = successful - ({row}.status = 'completed'),
+        failed = failed - ({row}.status = 'failed'),
+        totalDuration = totalDuration - COALESCE({row}.duration, 0),
+        durationCount = durationCount - ({row}.duration IS NOT NULL),
+        total = total - 1
+    WHERE {match};
+    DELETE FROM "DailyRollup" WHERE {match} AND total <= 0;
+    """
+
+
+DAILY_ROLLUP_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_insert"
+    AFTER INSERT ON "TaskExecution"
+    BEGIN {_rollup_add("NEW")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_update"
+    AFTER UPDATE OF taskId, status, startedAt, duration ON "TaskExecution"
+    BEGIN {_rollup_remove("OLD")} {_rollup_add("NEW")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_delete"
+    AFTER DELETE ON "TaskExecution"
+    BEGIN {_rollup_remove("OLD")} END
+    """,
+]
+
+DAILY_ROLLUP_BACKFILL = """
+INSERT INTO "DailyRollup" (date, taskId, successful, failed, totalDuration, durationCount, total)
+SELECT date(startedAt / 1000, 'unixepoch'), taskId,
+       SUM(status = 'completed'), SUM(status = 'failed'),
+       COALESCE(SUM(duration), 0), COUNT(duration), COUNT(*)
+FROM "TaskExecution"
+WHERE typeof(startedAt) = 'integer'
+GROUP BY 1, 2
+"""
+
+
+@event.listens_for(Base.metadata, "after_create")
+def install_daily_rollup_triggers(target, connection, **kw):
+    """Create the DailyRollup maintenance triggers after create_all().
+
+    When the DailyRollup table is created against an existing database it is
+    backfilled from TaskExecution so the triggers start from a correct base.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    if DailyRollup.__table__ in kw.get("tables", ()):
+        connection.exec_driver_sql(DAILY_ROLLUP_BACKFILL)
+
+    for statement in DAILY_ROLLUP_TRIGGERS:
+        connection.exec_driver_sql(statement)
+
+
 # ============================================================================
 # Pydantic Schemas (API Layer)
 # ============================================================================
@@ -1,27 +1,93 @@
 """
 Shared pytest fixtures for backend tests.
 """
+import os
+import tempfile
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from database import Base
+# Under pytest-xdist each worker gets its own application database file, so
+# workers starting the app (and its scheduler job store) never share one.
+# This must happen before database.py is imported and reads DATABASE_URL.
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _worker and "DATABASE_URL" not in os.environ:
+    _worker_db = os.path.join(tempfile.gettempdir(), f"ai-assistant-test-{_worker}.db")
+    for _suffix in ("", "-wal", "-shm"):
+        if os.path.exists(_worker_db + _suffix):
+            os.remove(_worker_db + _suffix)
+    os.environ["DATABASE_URL"] = f"sqlite:///{_worker_db}"
 
+from database import Base  # noqa: E402
+from models import User  # noqa: E402
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
 def engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    """Create one in-memory SQLite database shared by the whole test session.
+
+    The schema is created once; tests are isolated by ``db_session`` rolling
+    back everything they wrote. Under pytest-xdist every worker gets its own
+    named in-memory database, so workers never share state.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    engine = create_engine(
+        f"sqlite:///file:memdb_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+
+    # Let SQLAlchemy drive BEGIN/SAVEPOINT itself; pysqlite's implicit
+    # transaction handling otherwise breaks nested transactions.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     return engine
 
 
 @pytest.fixture(scope="function")
 def db_session(engine):
-    """Create a new database session for a test."""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    """Create a database session whose writes are rolled back after the test.
+
+    The session joins an outer transaction on a dedicated connection and
+    turns its own commit() calls into SAVEPOINT releases, so tests can commit
+    freely without leaking rows into the next test.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def shared_user(engine):
+    """Fetch or create one committed User for the whole session; yields its id.
+
+    Tables with a userId foreign key need an owner row to exist before they
+    can be seeded.
+    """
+    # The session is closed before yielding: the test engine shares a single
+    # connection, so it must not hold a transaction open under db_session.
+    with Session(bind=engine) as session:
+        user = session.query(User).first()
+        if user is None:
+            user = User(email="shared-user@example.com", name="Shared User", passwordHash="hashed")
+            session.add(user)
+            session.flush()
+        user_id = user.id
+        session.commit()
+    yield user_id
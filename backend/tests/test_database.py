@@ -0,0 +1,35 @@
+"""
+Tests for SQLite connection setup in database.py.
+"""
+
+from sqlalchemy import create_engine, text
+
+import database  # noqa: F401  (registers the SQLite connect listener)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_file_database_uses_wal(tmp_path):
+    """File-backed SQLite connections switch to WAL with relaxed fsync."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 3000
+        assert _pragma(engine, "foreign_keys") == 1
+    finally:
+        engine.dispose()
+
+
+def test_memory_database_skips_wal():
+    """In-memory SQLite keeps an in-memory journal and never fsyncs."""
+    engine = create_engine("sqlite://")
+    try:
+        assert _pragma(engine, "journal_mode") == "memory"
+        assert _pragma(engine, "synchronous") == 0  # OFF
+        assert _pragma(engine, "foreign_keys") == 1
+    finally:
+        engine.dispose()
@@ -14,31 +14,14 @@ import pytest
 import uuid
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy.orm import Session
 
-from database import Base
 from models import User, DigestSettings
+from scheduler import setup_digest_jobs, send_daily_digest_job, send_weekly_digest_job
 
-
-# Test database setup
-@pytest.fixture(scope="function")
-def engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture(scope="function")
-def db_session(engine):
-    """Create a new database session for a test."""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+# Unix ms timestamp shared by fixtures (timestamp columns are INTEGER)
+NOW_MS = int(datetime.now().timestamp() * 1000)
 
 
 @pytest.fixture
@@ -49,35 +32,67 @@ def sample_user(db_session: Session):
         email="test@example.com",
         name="Test User",
         passwordHash="$2b$10$somehashedpassword",
-        createdAt=datetime.utcnow(),
-        updatedAt=datetime.utcnow()
+        createdAt=NOW_MS,
+        updatedAt=NOW_MS
     )
     db_session.add(user)
     db_session.commit()
-    db_session.refresh(user)
     return user
 
 
+@pytest.fixture(scope="module")
+def _bg_spec():
+    """BackgroundScheduler class used as the mock spec."""
+    return BackgroundScheduler
+
+
+@pytest.fixture
+def mock_scheduler(_bg_spec):
+    """Create a fresh scheduler mock for a test."""
+    scheduler = Mock(spec=_bg_spec)
+    scheduler.add_job = Mock()
+    return scheduler
+
+
+@pytest.fixture
+def make_settings(db_session: Session):
+    """Factory for DigestSettings rows; pass only the fields a test cares about."""
+    def _make(**overrides):
+        defaults = dict(
+            id=str(uuid.uuid4()),
+            dailyEnabled=True,
+            dailyTime="20:00",
+            weeklyEnabled=True,
+            weeklyDay="monday",
+            weeklyTime="09:00",
+            recipientEmail="test@example.com"
+        )
+        defaults.update(overrides)
+        settings = DigestSettings(**defaults)
+        db_session.add(settings)
+        db_session.flush()
+        return settings
+    return _make
+
+
+def _jobs_by_id(mock):
+    """Index the add_job calls made on a scheduler mock by job id."""
+    return {c.kwargs.get('id'): c for c in mock.add_job.call_args_list}
+
+
 # ============================================================================
 # Default Settings Tests
 # ============================================================================
 
-def test_default_settings_created_on_first_run(engine, db_session):
+def test_default_settings_created_on_first_run(engine, db_session, mock_scheduler, monkeypatch):
     """Test that default DigestSettings are created if none exist."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Verify no settings exist initially
     settings = db_session.query(DigestSettings).first()
     assert settings is None
 
-    # Create a mock scheduler
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
-
     # Call setup with mock environment
-    with patch.dict('os.environ', {'USER_EMAIL': 'user@example.com'}):
-        setup_digest_jobs(mock_scheduler, db_session)
+    monkeypatch.setenv('USER_EMAIL', 'user@example.com')
+    setup_digest_jobs(mock_scheduler, db_session)
 
     # Verify settings were created
     settings = db_session.query(DigestSettings).first()
@@ -90,17 +105,11 @@ def test_default_settings_created_on_first_run(engine, db_session):
     assert settings.recipientEmail == "user@example.com"
 
 
-def test_default_settings_use_environment_email(engine, db_session):
+def test_default_settings_use_environment_email(engine, db_session, mock_scheduler, monkeypatch):
     """Test that default settings use USER_EMAIL from environment."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
-
     # Set custom email in environment
-    with patch.dict('os.environ', {'USER_EMAIL': 'custom@example.com'}):
-        setup_digest_jobs(mock_scheduler, db_session)
+    monkeypatch.setenv('USER_EMAIL', 'custom@example.com')
+    setup_digest_jobs(mock_scheduler, db_session)
 
     settings = db_session.query(DigestSettings).first()
     assert settings.recipientEmail == "custom@example.com"
@@ -110,103 +119,43 @@ def test_default_settings_use_environment_email(engine, db_session):
 # Job Scheduling Tests
 # ============================================================================
 
-def test_daily_job_scheduled_with_correct_time(engine, db_session):
+def test_daily_job_scheduled_with_correct_time(engine, db_session, mock_scheduler, make_settings):
     """Test that daily digest job is scheduled with correct cron time."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Create settings with custom daily time
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="18:30",
-        weeklyEnabled=False,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    make_settings(dailyTime="18:30", weeklyEnabled=False)
 
     setup_digest_jobs(mock_scheduler, db_session)
 
     # Verify daily job was added
     assert mock_scheduler.add_job.called
 
-    # Find the daily job call
-    daily_job_call = None
-    for call in mock_scheduler.add_job.call_args_list:
-        if call[1].get('id') == 'daily_digest':
-            daily_job_call = call
-            break
-
-    assert daily_job_call is not None
+    jobs = _jobs_by_id(mock_scheduler)
+    assert 'daily_digest' in jobs
     # Verify replace_existing is True
-    assert daily_job_call[1].get('replace_existing') is True
+    assert jobs['daily_digest'].kwargs['replace_existing'] is True
 
 
-def test_weekly_job_scheduled_with_correct_day_and_time(engine, db_session):
+def test_weekly_job_scheduled_with_correct_day_and_time(engine, db_session, mock_scheduler, make_settings):
     """Test that weekly digest job is scheduled with correct day and time."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Create settings with custom weekly schedule
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=False,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="friday",
-        weeklyTime="10:15",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    make_settings(dailyEnabled=False, weeklyDay="friday", weeklyTime="10:15")
 
     setup_digest_jobs(mock_scheduler, db_session)
 
-    # Find the weekly job call
-    weekly_job_call = None
-    for call in mock_scheduler.add_job.call_args_list:
-        if call[1].get('id') == 'weekly_digest':
-            weekly_job_call = call
-            break
-
-    assert weekly_job_call is not None
+    jobs = _jobs_by_id(mock_scheduler)
+    assert 'weekly_digest' in jobs
     # Verify replace_existing is True
-    assert weekly_job_call[1].get('replace_existing') is True
+    assert jobs['weekly_digest'].kwargs['replace_existing'] is True
 
 
 # ============================================================================
 # Enable/Disable Tests
 # ============================================================================
 
-def test_jobs_disabled_when_enabled_false(engine, db_session):
+def test_jobs_disabled_when_enabled_false(engine, db_session, mock_scheduler, make_settings):
     """Test that jobs are not scheduled when enabled=false."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Create settings with both disabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=False,
-        dailyTime="20:00",
-        weeklyEnabled=False,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    make_settings(dailyEnabled=False, weeklyEnabled=False)
 
     setup_digest_jobs(mock_scheduler, db_session)
 
@@ -214,26 +163,10 @@ def test_jobs_disabled_when_enabled_false(engine, db_session):
     assert not mock_scheduler.add_job.called
 
 
-def test_only_enabled_jobs_are_scheduled(engine, db_session):
+def test_only_enabled_jobs_are_scheduled(engine, db_session, mock_scheduler, make_settings):
     """Test that only enabled jobs are scheduled."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Create settings with only daily enabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=False,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    make_settings(weeklyEnabled=False)
 
     setup_digest_jobs(mock_scheduler, db_session)
 
@@ -246,26 +179,10 @@ def test_only_enabled_jobs_are_scheduled(engine, db_session):
 # Job Rescheduling Tests
 # ============================================================================
 
-def test_jobs_rescheduled_when_settings_updated(engine, db_session):
+def test_jobs_rescheduled_when_settings_updated(engine, db_session, mock_scheduler, make_settings):
     """Test that jobs are rescheduled when settings are updated."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
     # Create initial settings
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    settings = make_settings()
 
     # Initial setup
     setup_digest_jobs(mock_scheduler, db_session)
@@ -286,25 +203,9 @@ def test_jobs_rescheduled_when_settings_updated(engine, db_session):
     assert mock_scheduler.add_job.called
 
 
-def test_jobs_use_replace_existing_flag(engine, db_session):
+def test_jobs_use_replace_existing_flag(engine, db_session, mock_scheduler, make_settings):
     """Test that jobs use replace_existing=True to allow rescheduling."""
-    from scheduler import setup_digest_jobs
-    from apscheduler.schedulers.background import BackgroundScheduler
-
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    mock_scheduler = Mock(spec=BackgroundScheduler)
-    mock_scheduler.add_job = Mock()
+    make_settings()
 
     setup_digest_jobs(mock_scheduler, db_session)
 
@@ -317,142 +218,40 @@ def test_jobs_use_replace_existing_flag(engine, db_session):
 # Job Function Tests
 # ============================================================================
 
-def test_send_daily_digest_job_checks_enabled(engine, db_session):
-    """Test that send_daily_digest_job checks if daily digest is enabled."""
-    from scheduler import send_daily_digest_job
-
-    # Create settings with daily disabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=False,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    # Mock GmailSender
-    with patch('gmail_sender.get_gmail_sender') as mock_sender:
-        mock_sender_instance = Mock()
-        mock_sender.return_value = mock_sender_instance
-
-        # Mock SessionLocal to return our test session
-        def mock_session_local():
-            return db_session
-
-        with patch('database.SessionLocal', return_value=mock_session_local()):
-            send_daily_digest_job()
-
-        # Verify email was NOT sent (daily disabled)
-        assert not mock_sender_instance.send_daily_digest.called
-
-
-def test_send_daily_digest_job_sends_when_enabled(engine, db_session):
-    """Test that send_daily_digest_job sends email when enabled."""
-    from scheduler import send_daily_digest_job
-
-    # Create settings with daily enabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    # Mock GmailSender
-    with patch('gmail_sender.get_gmail_sender') as mock_sender:
-        mock_sender_instance = Mock()
-        mock_sender_instance.send_daily_digest = Mock()
-        mock_sender.return_value = mock_sender_instance
-
-        # Mock SessionLocal to return our test session
-        def mock_session_local():
-            return db_session
-
-        with patch('database.SessionLocal', return_value=mock_session_local()):
-            send_daily_digest_job()
-
-        # Verify email was sent with correct recipient
-        mock_sender_instance.send_daily_digest.assert_called_once()
-        call_args = mock_sender_instance.send_daily_digest.call_args
-        assert call_args[0][1] == "test@example.com"
-
-
-def test_send_weekly_digest_job_checks_enabled(engine, db_session):
-    """Test that send_weekly_digest_job checks if weekly digest is enabled."""
-    from scheduler import send_weekly_digest_job
-
-    # Create settings with weekly disabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=False,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
-
-    # Mock GmailSender
-    with patch('gmail_sender.get_gmail_sender') as mock_sender:
-        mock_sender_instance = Mock()
-        mock_sender.return_value = mock_sender_instance
-
-        # Mock SessionLocal to return our test session
-        def mock_session_local():
-            return db_session
+_DIGEST_JOBS = {
+    "send_daily_digest_job": send_daily_digest_job,
+    "send_weekly_digest_job": send_weekly_digest_job,
+}
 
-        with patch('database.SessionLocal', return_value=mock_session_local()):
-            send_weekly_digest_job()
 
-        # Verify email was NOT sent (weekly disabled)
-        assert not mock_sender_instance.send_weekly_summary.called
+@pytest.mark.parametrize("job_import,daily,weekly,method,should_send", [
+    ("send_daily_digest_job", False, True, "send_daily_digest", False),
+    ("send_daily_digest_job", True, True, "send_daily_digest", True),
+    ("send_weekly_digest_job", True, False, "send_weekly_summary", False),
+    ("send_weekly_digest_job", True, True, "send_weekly_summary", True),
+])
+def test_send_digest_job_respects_enabled(engine, db_session, make_settings, monkeypatch, job_import, daily, weekly, method, should_send):
+    """Test that digest jobs only send email when their digest is enabled."""
+    settings = make_settings(dailyEnabled=daily, weeklyEnabled=weekly)
 
-
-def test_send_weekly_digest_job_sends_when_enabled(engine, db_session):
-    """Test that send_weekly_digest_job sends email when enabled."""
-    from scheduler import send_weekly_digest_job
-
-    # Create settings with weekly enabled
-    settings = DigestSettings(
-        id=str(uuid.uuid4()),
-        dailyEnabled=True,
-        dailyTime="20:00",
-        weeklyEnabled=True,
-        weeklyDay="monday",
-        weeklyTime="09:00",
-        recipientEmail="test@example.com"
-    )
-    db_session.add(settings)
-    db_session.commit()
+    # Point SessionLocal at our test session
+    monkeypatch.setattr('database.SessionLocal', lambda: db_session)
 
     # Mock GmailSender
     with patch('gmail_sender.get_gmail_sender') as mock_sender:
         mock_sender_instance = Mock()
-        mock_sender_instance.send_weekly_summary = Mock()
         mock_sender.return_value = mock_sender_instance
 
-        # Mock SessionLocal to return our test session
-        def mock_session_local():
-            return db_session
-
-        with patch('database.SessionLocal', return_value=mock_session_local()):
-            send_weekly_digest_job()
+        _DIGEST_JOBS[job_import]()
 
+    send = getattr(mock_sender_instance, method)
+    if should_send:
         # Verify email was sent with correct recipient
-        mock_sender_instance.send_weekly_summary.assert_called_once()
-        call_args = mock_sender_instance.send_weekly_summary.call_args
-        assert call_args[0][1] == "test@example.com"
+        send.assert_called_once()
+        assert send.call_args[0][1] == settings.recipientEmail
+    else:
+        # Verify email was NOT sent (digest disabled)
+        assert not send.called
 
 
 # ============================================================================
@@ -9,9 +9,13 @@ from email_templates import (
 )
 
 
-def test_render_task_completion_email():
-    """Test task completion email template."""
-    task_data = {
+# Renders are deterministic, so each template is rendered once per session
+# and shared by every test that asserts on it.
+
+@pytest.fixture(scope="session")
+def completion_email():
+    """Rendered (html, text) task completion email."""
+    return render_task_completion_email({
         'name': 'Daily Backup',
         'description': 'Backup database to Drive',
         'status': 'completed',
@@ -19,39 +23,25 @@ def test_render_task_completion_email():
         'output_summary': 'Backup created successfully',
         'drive_link': 'https://drive.google.com/file/d/abc123',
         'next_run': '2026-02-05 03:00:00'
-    }
-
-    html, text = render_task_completion_email(task_data)
-
-    assert '✅' in html
-    assert 'Daily Backup' in html
-    assert '1.2s' in html
-    assert 'drive.google.com' in html
-    assert 'Daily Backup' in text
+    })
 
 
-def test_render_task_failure_email():
-    """Test task failure email template."""
-    task_data = {
+@pytest.fixture(scope="session")
+def failure_email():
+    """Rendered (html, text) task failure email."""
+    return render_task_failure_email({
         'name': 'Data Sync',
         'description': 'Sync data from API',
         'error_message': 'Connection timeout',
         'retry_history': '3 attempts (1min, 5min, 15min)',
         'error_logs': 'Full stack trace here...'
-    }
+    })
 
-    html, text = render_task_failure_email(task_data)
 
-    assert '❌' in html
-    assert 'Data Sync' in html
-    assert 'Connection timeout' in html
-    assert '3 attempts' in html
-    assert 'Data Sync' in text
-
-
-def test_render_daily_digest_email():
-    """Test daily digest email template."""
-    digest_data = {
+@pytest.fixture(scope="session")
+def daily_digest_email():
+    """Rendered (html, text) daily digest email."""
+    return render_daily_digest_email({
         'date': '2026-02-04',
         'total_tasks': 5,
         'successful': 4,
@@ -61,19 +51,13 @@ def test_render_daily_digest_email():
             {'name': 'Morning Backup', 'time': '03:00'},
             {'name': 'Data Sync', 'time': '08:00'}
         ]
-    }
+    })
 
-    html, text = render_daily_digest_email(digest_data)
 
-    assert '📊' in html
-    assert '2026-02-04' in html
-    assert '80%' in html
-    assert 'Morning Backup' in html
-
-
-def test_render_weekly_summary_email():
-    """Test weekly summary email template."""
-    summary_data = {
+@pytest.fixture(scope="session")
+def weekly_summary_email():
+    """Rendered (html, text) weekly summary email."""
+    return render_weekly_summary_email({
         'week_start': '2026-02-03',
         'week_end': '2026-02-09',
         'total_executions': 35,
@@ -84,9 +68,44 @@ def test_render_weekly_summary_email():
             {'task': 'Email Check', 'count': 1}
         ],
         'report_link': 'https://drive.google.com/file/d/xyz789'
-    }
+    })
+
 
-    html, text = render_weekly_summary_email(summary_data)
+def test_render_task_completion_email(completion_email):
+    """Test task completion email template."""
+    html, text = completion_email
+
+    assert '✅' in html
+    assert 'Daily Backup' in html
+    assert '1.2s' in html
+    assert 'drive.google.com' in html
+    assert 'Daily Backup' in text
+
+
+def test_render_task_failure_email(failure_email):
+    """Test task failure email template."""
+    html, text = failure_email
+
+    assert '❌' in html
+    assert 'Data Sync' in html
+    assert 'Connection timeout' in html
+    assert '3 attempts' in html
+    assert 'Data Sync' in text
+
+
+def test_render_daily_digest_email(daily_digest_email):
+    """Test daily digest email template."""
+    html, text = daily_digest_email
+
+    assert '📊' in html
+    assert '2026-02-04' in html
+    assert '80%' in html
+    assert 'Morning Backup' in html
+
+
+def test_render_weekly_summary_email(weekly_summary_email):
+    """Test weekly summary email template."""
+    html, text = weekly_summary_email
 
     assert '📈' in html
     assert 'Week' in html
@@ -1,260 +1,217 @@
 """Tests for multi-agent executor integration."""
 
 import pytest
-import asyncio
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch, AsyncMock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from unittest.mock import AsyncMock
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
-from models import Base, Task, TaskExecution, ActivityLog
+from models import Task, TaskExecution, ActivityLog
 from executor import execute_task
 
 
-# Setup in-memory database for testing
-@pytest.fixture
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-
-
-@pytest.mark.asyncio
-async def test_execute_task_routes_to_multi_agent(db_session):
-    """Test that multi-agent tasks are routed correctly."""
-    # Create multi-agent task
-    task = Task(
-        id="task_multi_agent",
-        userId="user_123",  # Required field
-        name="Multi-Agent Test Task",
-        description="Test multi-agent execution",
-        command="test",
-        args="",
-        schedule="manual",
-        notifyOn="completion,error",
-        task_metadata={  # Use task_metadata instead of metadata
-            "agents": {
-                "enabled": True,
-                "sequence": ["research", "execute"],
-                "synthesize": False,
-                "roles": {
-                    "research": {"type": "research"},
-                    "execute": {"type": "execute"}
-                }
+_RESEARCH_ONLY = {
+    "agents": {
+        "enabled": True,
+        "sequence": ["research"],
+        "roles": {
+            "research": {"type": "research"}
+        }
+    }
+}
+
+
+def _research_then_execute(synthesize):
+    return {
+        "agents": {
+            "enabled": True,
+            "sequence": ["research", "execute"],
+            "synthesize": synthesize,
+            "roles": {
+                "research": {"type": "research"},
+                "execute": {"type": "execute"}
             }
         }
-    )
-    db_session.add(task)
-    db_session.commit()
-
-    # Mock multi-agent execution
-    mock_result = {
-        "status": "completed",
-        "completed_agents": ["research", "execute"],
-        "workspace": "/tmp/test_workspace"
     }
 
-    with patch("executor.execute_multi_agent_task", new_callable=AsyncMock) as mock_multi_agent:
-        mock_multi_agent.return_value = mock_result
 
-        output, exit_code = await execute_task(task.id, db_session)
+# Every test task is inserted once per module; each test looks up its row by id
+_SEEDED_TASKS = {
+    "task_multi_agent": _research_then_execute(synthesize=False),
+    "task_multi_agent_fail": _RESEARCH_ONLY,
+    "task_with_synthesis": _research_then_execute(synthesize=True),
+    "task_with_logs": _RESEARCH_ONLY,
+    "task_single_agent": {},
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _seeded_tasks(engine, shared_user):
+    """Commit every test task in a single batch for the module, removed at teardown.
+
+    Executions and activity logs written by each test are rolled back by
+    db_session; only these task rows outlive a single test.
+    """
+    with Session(bind=engine) as session:
+        session.add_all([
+            Task(
+                id=task_id,
+                userId=shared_user,
+                name=f"Test Task ({task_id})",
+                description="Test task execution",
+                command="test",
+                args="",
+                schedule="manual",
+                notifyOn="completion,error",
+                task_metadata=metadata  # Use task_metadata instead of metadata
+            )
+            for task_id, metadata in _SEEDED_TASKS.items()
+        ])
+        session.commit()
+    yield
+    with Session(bind=engine) as session:
+        session.query(Task).filter(Task.id.in_(_SEEDED_TASKS)).delete(synchronize_session=False)
+        session.commit()
+
+
+@pytest.fixture(scope="module")
+def _multi_agent_mock():
+    """One AsyncMock shared by every multi-agent test in the module."""
+    return AsyncMock()
 
-        # Verify multi-agent execution was called
-        assert mock_multi_agent.called
-        assert exit_code == 0
 
-        # Verify execution record created
-        execution = db_session.query(TaskExecution).filter_by(taskId=task.id).first()
-        assert execution is not None
-        assert execution.status == "completed"
+@pytest.fixture
+def mock_execute_multi_agent(mocker, _multi_agent_mock):
+    """Patch execute_multi_agent_task with the shared mock, reset for this test."""
+    _multi_agent_mock.reset_mock(return_value=True, side_effect=True)
+    mocker.patch("executor.execute_multi_agent_task", _multi_agent_mock)
+    return _multi_agent_mock
 
-        # Verify output contains multi-agent info
-        assert "multi-agent" in output.lower() or "research" in output.lower()
 
+async def _aiter(items):
+    """Async iterator over a fixed list, standing in for streamed output."""
+    for item in items:
+        yield item
 
-@pytest.mark.asyncio
-async def test_execute_task_single_agent_fallback(db_session):
-    """Test that non-multi-agent tasks use single-agent execution."""
-    # Create regular task (no multi-agent metadata)
-    task = Task(
-        id="task_single_agent",
-        userId="user_123",
-        name="Single-Agent Test Task",
-        description="Test single-agent execution",
-        command="test",
-        args="",
-        schedule="manual",
-        notifyOn="completion,error",
-        task_metadata={}
-    )
-    db_session.add(task)
-    db_session.commit()
 
-    # Mock single-agent execution (Claude subprocess)
-    async def mock_execute_claude(*args, **kwargs):
-        yield "Task output"
-        yield "Task completed successfully (exit code: 0)"
-
-    with patch("executor.execute_claude_task", side_effect=mock_execute_claude):
-        output, exit_code = await execute_task(task.id, db_session)
-
-        assert exit_code == 0
-
-        # Verify execution record created
-        execution = db_session.query(TaskExecution).filter_by(taskId=task.id).first()
-        assert execution is not None
-        assert execution.status == "completed"
-
-
-@pytest.mark.asyncio
-async def test_execute_task_multi_agent_failure(db_session):
-    """Test multi-agent task failure handling."""
-    # Create multi-agent task
-    task = Task(
-        id="task_multi_agent_fail",
-        userId="user_123",
-        name="Multi-Agent Fail Task",
-        description="Test multi-agent failure",
-        command="test",
-        args="",
-        schedule="manual",
-        notifyOn="completion,error",
-        task_metadata={
-            "agents": {
-                "enabled": True,
-                "sequence": ["research"],
-                "roles": {
-                    "research": {"type": "research"}
-                }
-            }
-        }
-    )
-    db_session.add(task)
-    db_session.commit()
-
-    # Mock multi-agent execution failure
-    mock_result = {
-        "status": "failed",
-        "failed_agent": "research",
-        "completed_agents": [],
-        "error": "Agent failed",
-        "workspace": "/tmp/test_workspace"
-    }
+def _execution(db_session, task_id):
+    return db_session.execute(
+        select(TaskExecution).where(TaskExecution.taskId == task_id)
+    ).scalars().first()
 
-    with patch("executor.execute_multi_agent_task", new_callable=AsyncMock) as mock_multi_agent:
-        mock_multi_agent.return_value = mock_result
-
-        output, exit_code = await execute_task(task.id, db_session)
-
-        # Verify failure recorded
-        assert exit_code == 1
-
-        execution = db_session.query(TaskExecution).filter_by(taskId=task.id).first()
-        assert execution is not None
-        assert execution.status == "failed"
-
-        # Verify output contains failure info
-        assert "failed" in output.lower()
-
-
-@pytest.mark.asyncio
-async def test_execute_task_multi_agent_with_synthesis(db_session):
-    """Test multi-agent task with synthesis."""
-    # Create multi-agent task with synthesis
-    task = Task(
-        id="task_with_synthesis",
-        userId="user_123",
-        name="Multi-Agent with Synthesis",
-        description="Test synthesis",
-        command="test",
-        args="",
-        schedule="manual",
-        notifyOn="completion,error",
-        task_metadata={
-            "agents": {
-                "enabled": True,
-                "sequence": ["research", "execute"],
-                "synthesize": True,
-                "roles": {
-                    "research": {"type": "research"},
-                    "execute": {"type": "execute"}
-                }
-            }
-        }
-    )
-    db_session.add(task)
-    db_session.commit()
-
-    # Mock multi-agent execution with synthesis
-    mock_result = {
-        "status": "completed",
-        "completed_agents": ["research", "execute"],
-        "workspace": "/tmp/test_workspace",
-        "synthesis": {
-            "summary": "Task completed successfully",
-            "key_achievements": ["Achievement 1"]
+
+def _assert_routed(output, db_session, task_id):
+    # Verify execution record created
+    execution = _execution(db_session, task_id)
+    assert execution is not None
+    assert execution.status == "completed"
+
+    # Verify output contains multi-agent info
+    assert "multi-agent" in output.lower() or "research" in output.lower()
+
+
+def _assert_failed(output, db_session, task_id):
+    execution = _execution(db_session, task_id)
+    assert execution is not None
+    assert execution.status == "failed"
+
+    # Verify output contains failure info
+    assert "failed" in output.lower()
+
+
+def _assert_synthesized(output, db_session, task_id):
+    assert _execution(db_session, task_id) is not None
+
+    # Verify output contains synthesis results
+    assert "synthesis" in output.lower() or "summary" in output.lower()
+
+
+def _assert_activity_logged(output, db_session, task_id):
+    # Should have at least task_start and task_complete logs
+    assert len(db_session.execute(select(ActivityLog)).scalars().all()) >= 2
+
+
+@pytest.mark.parametrize("task_id, mock_result, expected_exit, assertions", [
+    pytest.param(
+        "task_multi_agent",
+        {
+            "status": "completed",
+            "completed_agents": ["research", "execute"],
+            "workspace": "/tmp/test_workspace"
         },
-        "synthesis_duration_ms": 5000
-    }
+        0,
+        _assert_routed,
+        id="routes_to_multi_agent",
+    ),
+    pytest.param(
+        "task_multi_agent_fail",
+        {
+            "status": "failed",
+            "failed_agent": "research",
+            "completed_agents": [],
+            "error": "Agent failed",
+            "workspace": "/tmp/test_workspace"
+        },
+        1,
+        _assert_failed,
+        id="multi_agent_failure",
+    ),
+    pytest.param(
+        "task_with_synthesis",
+        {
+            "status": "completed",
+            "completed_agents": ["research", "execute"],
+            "workspace": "/tmp/test_workspace",
+            "synthesis": {
+                "summary": "Task completed successfully",
+                "key_achievements": ["Achievement 1"]
+            },
+            "synthesis_duration_ms": 5000
+        },
+        0,
+        _assert_synthesized,
+        id="multi_agent_with_synthesis",
+    ),
+    pytest.param(
+        "task_with_logs",
+        {
+            "status": "completed",
+            "completed_agents": ["research"],
+            "workspace": "/tmp/test_workspace"
+        },
+        0,
+        _assert_activity_logged,
+        id="activity_logs_for_agents",
+    ),
+])
+async def test_execute_task_multi_agent(db_session, mock_execute_multi_agent, task_id, mock_result, expected_exit, assertions):
+    """Test that multi-agent tasks are routed to the multi-agent executor."""
+    task = db_session.get(Task, task_id)
+    mock_execute_multi_agent.return_value = mock_result
 
-    with patch("executor.execute_multi_agent_task", new_callable=AsyncMock) as mock_multi_agent:
-        mock_multi_agent.return_value = mock_result
-
-        output, exit_code = await execute_task(task.id, db_session)
-
-        assert exit_code == 0
-
-        execution = db_session.query(TaskExecution).filter_by(taskId=task.id).first()
-        assert execution is not None
-
-        # Verify output contains synthesis results
-        assert "synthesis" in output.lower() or "summary" in output.lower()
-
-
-@pytest.mark.asyncio
-async def test_execute_task_activity_logs_for_agents(db_session):
-    """Test that activity logs are created for multi-agent execution."""
-    # Create multi-agent task
-    task = Task(
-        id="task_with_logs",
-        userId="user_123",
-        name="Multi-Agent with Logs",
-        description="Test activity logs",
-        command="test",
-        args="",
-        schedule="manual",
-        notifyOn="completion,error",
-        task_metadata={
-            "agents": {
-                "enabled": True,
-                "sequence": ["research"],
-                "roles": {
-                    "research": {"type": "research"}
-                }
-            }
-        }
-    )
-    db_session.add(task)
-    db_session.commit()
-
-    # Mock multi-agent execution
-    mock_result = {
-        "status": "completed",
-        "completed_agents": ["research"],
-        "workspace": "/tmp/test_workspace"
-    }
+    output, exit_code = await execute_task(task.id, db_session)
+
+    # Verify multi-agent execution was called
+    assert mock_execute_multi_agent.called
+    assert exit_code == expected_exit
+    assertions(output, db_session, task.id)
 
-    with patch("executor.execute_multi_agent_task", new_callable=AsyncMock) as mock_multi_agent:
-        mock_multi_agent.return_value = mock_result
 
-        await execute_task(task.id, db_session)
+async def test_execute_task_single_agent_fallback(db_session, mocker):
+    """Test that non-multi-agent tasks use single-agent execution."""
+    # Regular task (no multi-agent metadata)
+    task = db_session.get(Task, "task_single_agent")
+
+    # Mock single-agent execution (Claude subprocess)
+    mocker.patch(
+        "executor.execute_claude_task",
+        return_value=_aiter(["Task output", "Task completed successfully (exit code: 0)"])
+    )
+
+    output, exit_code = await execute_task(task.id, db_session)
 
-        # Verify activity logs created
-        logs = db_session.query(ActivityLog).all()
+    assert exit_code == 0
 
-        # Should have at least task_start and task_complete logs
-        assert len(logs) >= 2
+    # Verify execution record created
+    execution = _execution(db_session, task.id)
+    assert execution is not None
+    assert execution.status == "completed"
@@ -7,30 +7,90 @@ listing messages, searching, and downloading attachments.
 
 import base64
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from datetime import datetime
+from unittest.mock import Mock, MagicMock
 from googleapiclient.errors import HttpError
 
+from gmail_client import (
+    read_email,
+    list_emails,
+    search_emails,
+    download_attachment,
+    extract_text_from_payload,
+    parse_headers,
+    get_attachment_info,
+    get_gmail_service,
+)
+
+
+# API errors are immutable, so each is built once and raised wherever needed
+_ERR_404 = HttpError(resp=SimpleNamespace(status=404, reason='Not Found'), content=b'Not Found')
+_ERR_401 = HttpError(resp=SimpleNamespace(status=401, reason='Unauthorized'), content=b'Unauthorized')
+_ERR_429 = HttpError(resp=SimpleNamespace(status=429, reason='Too Many Requests'), content=b'Rate Limit Exceeded')
+
+# Encoded message bodies, computed once at import
+_B64_BODY = base64.urlsafe_b64encode(b'Test email body').decode('utf-8')
+_B64_ATTACHMENT_EMAIL_BODY = base64.urlsafe_b64encode(b'Email body with attachment').decode('utf-8')
+_B64_PLAIN = base64.urlsafe_b64encode(b'Plain text').decode('utf-8')
+_B64_HTML = base64.urlsafe_b64encode(b'<html><body>HTML content</body></html>').decode('utf-8')
+_B64_PDF = base64.urlsafe_b64encode(b'PDF file content').decode('utf-8')
+_B64_PLAIN_CONTENT = base64.urlsafe_b64encode(b'Plain text content').decode('utf-8')
+_B64_FIRST_PART = base64.urlsafe_b64encode(b'First part').decode('utf-8')
+_B64_SECOND_PART = base64.urlsafe_b64encode(b'Second part').decode('utf-8')
+
 
-# Mock the gmail_client module before importing
 @pytest.fixture
 def mock_credentials():
     """Mock Google credentials."""
-    mock_creds = Mock()
-    mock_creds.valid = True
-    mock_creds.expired = False
-    return mock_creds
+    return SimpleNamespace(valid=True, expired=False)
+
+
+@pytest.fixture(scope="session")
+def _gmail_service_template():
+    """Build the Gmail service mock once, with the API call chains pre-walked.
+
+    Returns the service and the ``execute`` leaves tests configure.
+    """
+    service = MagicMock()
+    messages = service.users.return_value.messages.return_value
+    leaves = [
+        messages.get.return_value.execute,
+        messages.list.return_value.execute,
+        messages.attachments.return_value.get.return_value.execute,
+    ]
+    return service, leaves
 
 
 @pytest.fixture
-def mock_gmail_service():
-    """Mock Gmail API service."""
-    return MagicMock()
+def mock_gmail_service(_gmail_service_template):
+    """Mock Gmail API service, reset so no state leaks between tests."""
+    service, leaves = _gmail_service_template
+    service.reset_mock()
+    for execute in leaves:
+        execute.reset_mock(return_value=True, side_effect=True)
+    return service
 
 
 @pytest.fixture
+def gmail_messages(mock_gmail_service):
+    """The ``users().messages()`` resource of the mock Gmail service."""
+    return mock_gmail_service.users.return_value.messages.return_value
+
+
+@pytest.fixture(autouse=True)
+def _patch_gmail_service(mocker, mock_gmail_service):
+    """Route every gmail_client call to the mock Gmail service."""
+    mocker.patch('gmail_client.get_gmail_service', return_value=mock_gmail_service)
+
+
+@pytest.fixture(scope="session")
 def sample_email_metadata():
-    """Sample email metadata from Gmail API."""
+    """Sample email metadata from Gmail API.
+
+    Session-scoped sample payloads are shared between tests; treat them as
+    read-only.
+    """
     return {
         'id': 'msg123',
         'threadId': 'thread456',
@@ -47,13 +107,13 @@ def sample_email_metadata():
             'mimeType': 'text/plain',
             'body': {
                 'size': 100,
-                'data': base64.urlsafe_b64encode(b'Test email body').decode('utf-8'),
+                'data': _B64_BODY,
             }
         }
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_email_with_attachment():
     """Sample email with attachment."""
     return {
@@ -69,7 +129,7 @@ def sample_email_with_attachment():
                 {
                     'mimeType': 'text/plain',
                     'body': {
-                        'data': base64.urlsafe_b64encode(b'Email body with attachment').decode('utf-8'),
+                        'data': _B64_ATTACHMENT_EMAIL_BODY,
                     }
                 },
                 {
@@ -85,7 +145,7 @@ def sample_email_with_attachment():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_message_list():
     """Sample message list response."""
     return {
@@ -101,14 +161,10 @@ def sample_message_list():
 class TestGmailClientReadEmail:
     """Test read_email function."""
 
-    @patch('gmail_client.get_gmail_service')
-    def test_read_email_success(self, mock_get_service, mock_gmail_service, sample_email_metadata):
+    def test_read_email_success(self, gmail_messages, sample_email_metadata):
         """Test successfully reading an email."""
-        from gmail_client import read_email
-
         # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().get().execute.return_value = sample_email_metadata
+        gmail_messages.get.return_value.execute.return_value = sample_email_metadata
 
         # Execute
         result = read_email('msg123')
@@ -123,32 +179,20 @@ class TestGmailClientReadEmail:
         assert 'body' in result
         assert 'Test email body' in result['body']
 
-        # Verify API call (check call_args instead of assert_called_once due to mock chaining)
-        call_args = mock_gmail_service.users().messages().get.call_args
-        assert call_args[1] == {'userId': 'me', 'id': 'msg123', 'format': 'full'}
+        # Verify API call
+        gmail_messages.get.assert_called_once_with(userId='me', id='msg123', format='full')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_read_email_not_found(self, mock_get_service, mock_gmail_service):
+    def test_read_email_not_found(self, gmail_messages):
         """Test reading non-existent email."""
-        from gmail_client import read_email
-
         # Setup mock to raise 404
-        mock_get_service.return_value = mock_gmail_service
-        mock_error = HttpError(
-            resp=Mock(status=404),
-            content=b'Not Found'
-        )
-        mock_gmail_service.users().messages().get().execute.side_effect = mock_error
+        gmail_messages.get.return_value.execute.side_effect = _ERR_404
 
         # Execute and verify exception
         with pytest.raises(ValueError, match="Email not found"):
             read_email('nonexistent')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_read_email_with_html_body(self, mock_get_service, mock_gmail_service):
+    def test_read_email_with_html_body(self, gmail_messages):
         """Test reading email with HTML body."""
-        from gmail_client import read_email
-
         # Setup mock with HTML content
         html_email = {
             'id': 'msg456',
@@ -161,20 +205,19 @@ class TestGmailClientReadEmail:
                     {
                         'mimeType': 'text/plain',
                         'body': {
-                            'data': base64.urlsafe_b64encode(b'Plain text').decode('utf-8'),
+                            'data': _B64_PLAIN,
                         }
                     },
                     {
                         'mimeType': 'text/html',
                         'body': {
-                            'data': base64.urlsafe_b64encode(b'<html><body>HTML content</body></html>').decode('utf-8'),
+                            'data': _B64_HTML,
                         }
                     }
                 ]
             }
         }
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().get().execute.return_value = html_email
+        gmail_messages.get.return_value.execute.return_value = html_email
 
         # Execute
         result = read_email('msg456')
@@ -190,14 +233,10 @@ class TestGmailClientReadEmail:
 class TestGmailClientListEmails:
     """Test list_emails function."""
 
-    @patch('gmail_client.get_gmail_service')
-    def test_list_emails_default(self, mock_get_service, mock_gmail_service, sample_message_list):
+    def test_list_emails_default(self, gmail_messages, sample_message_list):
         """Test listing emails with default parameters."""
-        from gmail_client import list_emails
-
         # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
+        gmail_messages.list.return_value.execute.return_value = sample_message_list
 
         # Execute
         result = list_emails()
@@ -207,31 +246,22 @@ class TestGmailClientListEmails:
         assert len(result['messages']) == 3
         assert result['messages'][0]['id'] == 'msg1'
 
-        # Verify API call (check call_args instead of assert_called_once due to mock chaining)
-        call_args = mock_gmail_service.users().messages().list.call_args
-        assert call_args[1] == {'userId': 'me', 'maxResults': 10, 'q': ''}
+        # Verify API call
+        gmail_messages.list.assert_called_once_with(userId='me', maxResults=10, q='')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_list_emails_with_query(self, mock_get_service, mock_gmail_service, sample_message_list):
+    def test_list_emails_with_query(self, gmail_messages, sample_message_list):
         """Test listing emails with custom query."""
-        from gmail_client import list_emails
-
         # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
+        gmail_messages.list.return_value.execute.return_value = sample_message_list
 
         # Execute
         result = list_emails(query='is:unread', max_results=5)
 
-        # Verify API call (check call_args instead of assert_called_once due to mock chaining)
-        call_args = mock_gmail_service.users().messages().list.call_args
-        assert call_args[1] == {'userId': 'me', 'maxResults': 5, 'q': 'is:unread'}
+        # Verify API call
+        gmail_messages.list.assert_called_once_with(userId='me', maxResults=5, q='is:unread')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_list_emails_pagination(self, mock_get_service, mock_gmail_service):
+    def test_list_emails_pagination(self, gmail_messages):
         """Test listing emails with pagination."""
-        from gmail_client import list_emails
-
         # Setup mock with pagination
         first_page = {
             'messages': [{'id': 'msg1'}, {'id': 'msg2'}],
@@ -241,8 +271,7 @@ class TestGmailClientListEmails:
             'messages': [{'id': 'msg3'}, {'id': 'msg4'}],
         }
 
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.side_effect = [first_page, second_page]
+        gmail_messages.list.return_value.execute.side_effect = [first_page, second_page]
 
         # Execute
         result = list_emails(max_results=4, include_all_pages=True)
@@ -252,14 +281,10 @@ class TestGmailClientListEmails:
         assert result['messages'][0]['id'] == 'msg1'
         assert result['messages'][3]['id'] == 'msg4'
 
-    @patch('gmail_client.get_gmail_service')
-    def test_list_emails_empty_result(self, mock_get_service, mock_gmail_service):
+    def test_list_emails_empty_result(self, gmail_messages):
         """Test listing emails with no results."""
-        from gmail_client import list_emails
-
         # Setup mock with empty result
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = {
+        gmail_messages.list.return_value.execute.return_value = {
             'resultSizeEstimate': 0,
         }
 
@@ -274,94 +299,43 @@ class TestGmailClientListEmails:
 class TestGmailClientSearchEmails:
     """Test search_emails function."""
 
-    @patch('gmail_client.get_gmail_service')
-    def test_search_by_sender(self, mock_get_service, mock_gmail_service, sample_message_list):
-        """Test searching emails by sender."""
-        from gmail_client import search_emails
-
+    @pytest.mark.parametrize("kwargs, expected_substrings", [
+        pytest.param({'from_email': 'sender@example.com'}, ['from:sender@example.com'], id='by_sender'),
+        pytest.param({'subject': 'Test Subject'}, ['subject:Test Subject'], id='by_subject'),
+        pytest.param({'after_date': datetime(2024, 1, 1)}, ['after:2024/01/01'], id='by_date'),
+        pytest.param(
+            {
+                'from_email': 'sender@example.com',
+                'subject': 'Invoice',
+                'after_date': datetime(2024, 1, 1),
+                'has_attachment': True,
+            },
+            ['from:sender@example.com', 'subject:Invoice', 'after:2024/01/01', 'has:attachment'],
+            id='combined_criteria',
+        ),
+    ])
+    def test_search_query_construction(self, gmail_messages, sample_message_list, kwargs, expected_substrings):
+        """Test that search criteria are turned into a Gmail query."""
         # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
+        gmail_messages.list.return_value.execute.return_value = sample_message_list
 
         # Execute
-        result = search_emails(from_email='sender@example.com')
+        search_emails(**kwargs)
 
         # Verify query construction
-        call_args = mock_gmail_service.users().messages().list.call_args
-        assert 'from:sender@example.com' in call_args[1]['q']
-
-    @patch('gmail_client.get_gmail_service')
-    def test_search_by_subject(self, mock_get_service, mock_gmail_service, sample_message_list):
-        """Test searching emails by subject."""
-        from gmail_client import search_emails
-
-        # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
-
-        # Execute
-        result = search_emails(subject='Test Subject')
-
-        # Verify query construction
-        call_args = mock_gmail_service.users().messages().list.call_args
-        assert 'subject:Test Subject' in call_args[1]['q']
-
-    @patch('gmail_client.get_gmail_service')
-    def test_search_by_date(self, mock_get_service, mock_gmail_service, sample_message_list):
-        """Test searching emails after a specific date."""
-        from gmail_client import search_emails
-
-        # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
-
-        # Execute
-        after_date = datetime(2024, 1, 1)
-        result = search_emails(after_date=after_date)
-
-        # Verify query construction
-        call_args = mock_gmail_service.users().messages().list.call_args
-        assert 'after:2024/01/01' in call_args[1]['q']
-
-    @patch('gmail_client.get_gmail_service')
-    def test_search_combined_criteria(self, mock_get_service, mock_gmail_service, sample_message_list):
-        """Test searching with multiple criteria."""
-        from gmail_client import search_emails
-
-        # Setup mock
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = sample_message_list
-
-        # Execute
-        result = search_emails(
-            from_email='sender@example.com',
-            subject='Invoice',
-            after_date=datetime(2024, 1, 1),
-            has_attachment=True
-        )
-
-        # Verify query construction
-        call_args = mock_gmail_service.users().messages().list.call_args
-        query = call_args[1]['q']
-        assert 'from:sender@example.com' in query
-        assert 'subject:Invoice' in query
-        assert 'after:2024/01/01' in query
-        assert 'has:attachment' in query
+        query = gmail_messages.list.call_args[1]['q']
+        for expected in expected_substrings:
+            assert expected in query
 
 
 class TestGmailClientDownloadAttachment:
     """Test download_attachment function."""
 
-    @patch('gmail_client.get_gmail_service')
-    def test_download_attachment_success(self, mock_get_service, mock_gmail_service):
+    def test_download_attachment_success(self, gmail_messages):
         """Test successfully downloading an attachment."""
-        from gmail_client import download_attachment
-
         # Setup mock
-        attachment_data = base64.urlsafe_b64encode(b'PDF file content').decode('utf-8')
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().attachments().get().execute.return_value = {
-            'data': attachment_data,
+        gmail_messages.attachments.return_value.get.return_value.execute.return_value = {
+            'data': _B64_PDF,
             'size': 16,
         }
 
@@ -373,37 +347,23 @@ class TestGmailClientDownloadAttachment:
         assert result['data'] == b'PDF file content'
         assert result['size'] == 16
 
-        # Verify API call (check call_args instead of assert_called_once due to mock chaining)
-        call_args = mock_gmail_service.users().messages().attachments().get.call_args
-        assert call_args[1] == {'userId': 'me', 'messageId': 'msg123', 'id': 'attach456'}
+        # Verify API call
+        gmail_messages.attachments.return_value.get.assert_called_once_with(userId='me', messageId='msg123', id='attach456')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_download_attachment_not_found(self, mock_get_service, mock_gmail_service):
+    def test_download_attachment_not_found(self, gmail_messages):
         """Test downloading non-existent attachment."""
-        from gmail_client import download_attachment
-
         # Setup mock to raise 404
-        mock_get_service.return_value = mock_gmail_service
-        mock_error = HttpError(
-            resp=Mock(status=404),
-            content=b'Not Found'
-        )
-        mock_gmail_service.users().messages().attachments().get().execute.side_effect = mock_error
+        gmail_messages.attachments.return_value.get.return_value.execute.side_effect = _ERR_404
 
         # Execute and verify exception
         with pytest.raises(ValueError, match="Attachment not found"):
             download_attachment('msg123', 'nonexistent')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_save_attachment_to_file(self, mock_get_service, mock_gmail_service, tmp_path):
+    def test_save_attachment_to_file(self, gmail_messages, tmp_path):
         """Test saving attachment to file."""
-        from gmail_client import download_attachment
-
         # Setup mock
-        attachment_data = base64.urlsafe_b64encode(b'PDF file content').decode('utf-8')
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().attachments().get().execute.return_value = {
-            'data': attachment_data,
+        gmail_messages.attachments.return_value.get.return_value.execute.return_value = {
+            'data': _B64_PDF,
             'size': 16,
         }
 
@@ -422,12 +382,10 @@ class TestGmailClientParsingUtilities:
 
     def test_extract_text_from_plain(self):
         """Test extracting text from plain text email."""
-        from gmail_client import extract_text_from_payload
-
         payload = {
             'mimeType': 'text/plain',
             'body': {
-                'data': base64.urlsafe_b64encode(b'Plain text content').decode('utf-8'),
+                'data': _B64_PLAIN_CONTENT,
             }
         }
 
@@ -436,21 +394,19 @@ class TestGmailClientParsingUtilities:
 
     def test_extract_text_from_multipart(self):
         """Test extracting text from multipart email."""
-        from gmail_client import extract_text_from_payload
-
         payload = {
             'mimeType': 'multipart/mixed',
             'parts': [
                 {
                     'mimeType': 'text/plain',
                     'body': {
-                        'data': base64.urlsafe_b64encode(b'First part').decode('utf-8'),
+                        'data': _B64_FIRST_PART,
                     }
                 },
                 {
                     'mimeType': 'text/plain',
                     'body': {
-                        'data': base64.urlsafe_b64encode(b'Second part').decode('utf-8'),
+                        'data': _B64_SECOND_PART,
                     }
                 }
             ]
@@ -462,8 +418,6 @@ class TestGmailClientParsingUtilities:
 
     def test_parse_headers(self):
         """Test parsing email headers."""
-        from gmail_client import parse_headers
-
         headers = [
             {'name': 'From', 'value': 'sender@example.com'},
             {'name': 'To', 'value': 'recipient@example.com'},
@@ -481,8 +435,6 @@ class TestGmailClientParsingUtilities:
 
     def test_get_attachment_info(self, sample_email_with_attachment):
         """Test extracting attachment information."""
-        from gmail_client import get_attachment_info
-
         result = get_attachment_info(sample_email_with_attachment)
 
         assert len(result) == 1
@@ -493,8 +445,6 @@ class TestGmailClientParsingUtilities:
 
     def test_get_attachment_info_no_attachments(self, sample_email_metadata):
         """Test extracting attachment info from email with no attachments."""
-        from gmail_client import get_attachment_info
-
         result = get_attachment_info(sample_email_metadata)
         assert result == []
 
@@ -502,47 +452,28 @@ class TestGmailClientParsingUtilities:
 class TestGmailClientErrorHandling:
     """Test error handling in Gmail client."""
 
-    @patch('gmail_client.get_gmail_service')
-    def test_authentication_error(self, mock_get_service):
+    def test_authentication_error(self, mocker):
         """Test handling authentication errors."""
-        from gmail_client import read_email
-
         # Setup mock to raise authentication error
-        mock_error = HttpError(
-            resp=Mock(status=401),
-            content=b'Unauthorized'
-        )
-        mock_get_service.side_effect = mock_error
+        mocker.patch('gmail_client.get_gmail_service', side_effect=_ERR_401)
 
         # Execute and verify exception
         with pytest.raises(ValueError, match="Authentication failed"):
             read_email('msg123')
 
-    @patch('gmail_client.get_gmail_service')
-    def test_rate_limit_error(self, mock_get_service, mock_gmail_service):
+    def test_rate_limit_error(self, gmail_messages):
         """Test handling rate limit errors."""
-        from gmail_client import list_emails
-
         # Setup mock to raise rate limit error
-        mock_get_service.return_value = mock_gmail_service
-        mock_error = HttpError(
-            resp=Mock(status=429),
-            content=b'Rate Limit Exceeded'
-        )
-        mock_gmail_service.users().messages().list().execute.side_effect = mock_error
+        gmail_messages.list.return_value.execute.side_effect = _ERR_429
 
         # Execute and verify exception
         with pytest.raises(ValueError, match="Rate limit exceeded"):
             list_emails()
 
-    @patch('gmail_client.get_gmail_service')
-    def test_network_error(self, mock_get_service, mock_gmail_service):
+    def test_network_error(self, gmail_messages):
         """Test handling network errors."""
-        from gmail_client import read_email
-
         # Setup mock to raise network error
-        mock_get_service.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().get().execute.side_effect = ConnectionError("Network unavailable")
+        gmail_messages.get.return_value.execute.side_effect = ConnectionError("Network unavailable")
 
         # Execute and verify exception
         with pytest.raises(ConnectionError):
@@ -552,18 +483,18 @@ class TestGmailClientErrorHandling:
 class TestGmailClientCredentials:
     """Test credential handling."""
 
-    @patch('gmail_client.Credentials.from_authorized_user_file')
-    @patch('os.path.exists')
-    def test_get_gmail_service_with_existing_credentials(self, mock_exists, mock_from_file):
+    def test_get_gmail_service_with_existing_credentials(self, mocker):
         """Test getting Gmail service with existing credentials."""
-        from gmail_client import get_gmail_service
-
         # Setup mocks
-        mock_exists.return_value = True
+        # build() authorizes through the credentials object, so this one
+        # needs a full Mock rather than a plain namespace
         mock_creds = Mock()
         mock_creds.valid = True
         mock_creds.expired = False
-        mock_from_file.return_value = mock_creds
+        mocker.patch('os.path.exists', return_value=True)
+        mock_from_file = mocker.patch(
+            'gmail_client.Credentials.from_authorized_user_file', return_value=mock_creds
+        )
 
         # Execute
         service = get_gmail_service()
@@ -572,13 +503,10 @@ class TestGmailClientCredentials:
         assert service is not None
         mock_from_file.assert_called_once()
 
-    @patch('os.path.exists')
-    def test_get_gmail_service_without_credentials(self, mock_exists):
+    def test_get_gmail_service_without_credentials(self, mocker):
         """Test getting Gmail service without credentials."""
-        from gmail_client import get_gmail_service
-
         # Setup mock
-        mock_exists.return_value = False
+        mocker.patch('os.path.exists', return_value=False)
 
         # Execute and verify exception
         with pytest.raises(FileNotFoundError, match="Credentials file not found"):
@@ -1,37 +1,184 @@
 """Tests for Gmail sending service."""
+import copy
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import contextmanager
+from unittest.mock import DEFAULT, Mock, patch, call, mock_open
 import base64
 from datetime import datetime
-from gmail_sender import GmailSender, get_gmail_sender
+from googleapiclient.errors import HttpError
+from gmail_sender import GmailSender, RECIPIENT_EMAIL, get_gmail_sender
 
 
-@pytest.fixture
-def mock_gmail_service():
-    """Mock Gmail API service."""
+# Built once; HttpError parses its content on construction
+_HTTP_500 = HttpError(resp=Mock(status=500), content=b'Server error')
+
+# Deterministic "now" for the digest and summary tests
+_FIXED_NOW = datetime(2026, 2, 4, 10, 30)
+
+_ATTACHMENT_OPEN = mock_open(read_data=b'file content')
+
+
+def _decoded_raw(call_args):
+    """Decode the raw MIME message passed to a send() call."""
+    return base64.urlsafe_b64decode(call_args.kwargs['body']['raw']).decode('utf-8')
+
+
+@contextmanager
+def _patched_gmail_api(service):
+    """Patch credential loading and build() so GmailSender gets ``service``."""
     with patch('gmail_sender.os.path.exists', return_value=True), \
-         patch('gmail_sender.Credentials.from_authorized_user_file') as mock_creds, \
-         patch('gmail_sender.build') as mock_build:
+         patch.multiple('gmail_sender', Credentials=DEFAULT, build=DEFAULT) as mocks:
 
         # Mock valid credentials
         mock_cred = Mock()
         mock_cred.valid = True
-        mock_creds.return_value = mock_cred
+        mocks['Credentials'].from_authorized_user_file.return_value = mock_cred
+        mocks['build'].return_value = service
+
+        yield
+
+
+class _FakeSend:
+    """Stand-in for ``users().messages().send``; records the last call."""
+
+    def __init__(self):
+        self.reset()
 
-        # Mock Gmail service
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
+    def reset(self):
+        self.called = False
+        self.call_args = None
+        self.result = {'id': 'msg_12345'}
+        self.side_effect = None
 
-        yield mock_service
+    def __call__(self, **kwargs):
+        self.called = True
+        self.call_args = call(**kwargs)
+        return self
+
+    def execute(self):
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.result
+
+
+class _FakeGmailService:
+    """Minimal Gmail API service: ``users().messages().send(...).execute()``."""
+
+    def __init__(self):
+        self.send = _FakeSend()
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+
+@pytest.fixture(scope="session")
+def _gmail_service_template():
+    """Fake Gmail API service, built once per session."""
+    return _FakeGmailService()
 
 
 @pytest.fixture
-def sender(mock_gmail_service):
-    """Create GmailSender instance with mocked service."""
-    return GmailSender()
+def mock_gmail_service(_gmail_service_template):
+    """Fake Gmail API service, wiped after each test."""
+    yield _gmail_service_template
+    _gmail_service_template.send.reset()
 
 
-def test_send_email_creates_multipart_message(sender, mock_gmail_service):
+@pytest.fixture
+def send_method(mock_gmail_service):
+    """The service's send() stub, captured once for assertions."""
+    return mock_gmail_service.send
+
+
+@pytest.fixture(scope="session")
+def sender(_gmail_service_template):
+    """Create GmailSender instance with mocked service once per session."""
+    with _patched_gmail_api(_gmail_service_template):
+        return GmailSender()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _primed_gmail_sender(sender):
+    """Install the session's sender as the get_gmail_sender() singleton."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('gmail_sender._gmail_sender', sender)
+        yield
+
+
+@pytest.fixture(scope="session")
+def _task_template_completion():
+    """Task stand-in for completion emails, built once per session."""
+    task = Mock(spec=['id', 'name', 'description', 'notifyOn', 'nextRun', 'task_metadata'])
+    task.id = 'task_123'
+    task.name = 'Test Task'
+    task.description = 'Test description'
+    task.notifyOn = 'completion,error'
+    task.nextRun = None
+    task.task_metadata = None
+    return task
+
+
+@pytest.fixture(scope="session")
+def _task_template_failure():
+    """Task stand-in for failure emails, built once per session."""
+    task = Mock(spec=['id', 'name', 'description', 'task_metadata'])
+    task.id = 'task_123'
+    task.name = 'Failed Task'
+    task.description = 'Test description'
+    task.task_metadata = None
+    return task
+
+
+@pytest.fixture(scope="session")
+def _exec_template_completed():
+    """Completed execution stand-in, built once per session."""
+    execution = Mock(spec=['id', 'status', 'duration', 'output', 'completedAt'])
+    execution.id = 'exec_456'
+    execution.status = 'completed'
+    execution.duration = 1200  # milliseconds
+    execution.output = 'Task completed successfully'
+    execution.completedAt = '2026-02-04T10:30:00'
+    return execution
+
+
+@pytest.fixture(scope="session")
+def _exec_template_failed():
+    """Failed execution stand-in, built once per session."""
+    execution = Mock(spec=['id', 'status', 'output', 'completedAt'])
+    execution.id = 'exec_456'
+    execution.status = 'failed'
+    execution.output = 'Error: Connection timeout'
+    execution.completedAt = '2026-02-04T10:30:00'
+    return execution
+
+
+# Shallow copies give each test its own attribute values to override
+# without rebuilding the spec'd mocks.
+
+@pytest.fixture
+def task_completion(_task_template_completion):
+    return copy.copy(_task_template_completion)
+
+
+@pytest.fixture
+def task_failure(_task_template_failure):
+    return copy.copy(_task_template_failure)
+
+
+@pytest.fixture
+def execution_completed(_exec_template_completed):
+    return copy.copy(_exec_template_completed)
+
+
+@pytest.fixture
+def execution_failed(_exec_template_failed):
+    return copy.copy(_exec_template_failed)
+
+
+def test_send_email_creates_multipart_message(sender, send_method):
     """Test send_email creates proper multipart message."""
     sender.send_email(
         to='user@example.com',
@@ -41,17 +188,17 @@ def test_send_email_creates_multipart_message(sender, mock_gmail_service):
     )
 
     # Verify send was called
-    assert mock_gmail_service.users().messages().send.called
-    call_args = mock_gmail_service.users().messages().send.call_args
+    assert send_method.called
+    call_args = send_method.call_args
 
     # Verify message structure
-    assert call_args[1]['userId'] == 'me'
-    assert 'raw' in call_args[1]['body']
+    assert call_args.kwargs['userId'] == 'me'
+    assert 'raw' in call_args.kwargs['body']
 
 
-def test_send_email_returns_message_id(sender, mock_gmail_service):
+def test_send_email_returns_message_id(sender, send_method):
     """Test send_email returns Gmail message ID."""
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -64,41 +211,27 @@ def test_send_email_returns_message_id(sender, mock_gmail_service):
     assert message_id == 'msg_12345'
 
 
-def test_send_email_with_attachments(sender, mock_gmail_service):
+def test_send_email_with_attachments(sender, send_method):
     """Test send_email handles attachments."""
-    with patch('gmail_sender.os.path.exists', return_value=True):
-        with patch('gmail_sender.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = b'file content'
-
-            sender.send_email(
-                to='user@example.com',
-                subject='Test',
-                body_html='<p>Test</p>',
-                attachments=['test.txt']
-            )
+    with patch('gmail_sender.os.path.exists', return_value=True), \
+         patch('gmail_sender.open', _ATTACHMENT_OPEN, create=True):
+        sender.send_email(
+            to='user@example.com',
+            subject='Test',
+            body_html='<p>Test</p>',
+            attachments=['test.txt']
+        )
 
     # Verify send was called with attachment
-    assert mock_gmail_service.users().messages().send.called
+    assert send_method.called
 
 
-def test_send_task_completion_email(sender, mock_gmail_service):
+def test_send_task_completion_email(sender, send_method, task_completion, execution_completed):
     """Test send_task_completion_email uses correct template."""
-    task = Mock(spec=['id', 'name', 'description', 'notifyOn', 'nextRun', 'task_metadata'])
-    task.id = 'task_123'
-    task.name = 'Test Task'
-    task.description = 'Test description'
-    task.notifyOn = 'completion,error'
-    task.nextRun = None
-    task.task_metadata = None
-
-    execution = Mock(spec=['id', 'status', 'duration', 'output', 'completedAt'])
-    execution.id = 'exec_456'
-    execution.status = 'completed'
-    execution.duration = 1200  # milliseconds
-    execution.output = 'Task completed successfully'
-    execution.completedAt = '2026-02-04T10:30:00'
+    task = task_completion
+    execution = execution_completed
 
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -107,30 +240,19 @@ def test_send_task_completion_email(sender, mock_gmail_service):
     assert message_id == 'msg_12345'
 
     # Verify email was sent with correct parameters
-    assert mock_gmail_service.users().messages().send.called
-    call_args = mock_gmail_service.users().messages().send.call_args
-    assert call_args[1]['userId'] == 'me'
-    assert 'raw' in call_args[1]['body']
+    assert send_method.called
+    call_args = send_method.call_args
+    assert call_args.kwargs['userId'] == 'me'
+    assert 'raw' in call_args.kwargs['body']
 
 
-def test_send_task_completion_email_with_custom_recipient(sender, mock_gmail_service):
+def test_send_task_completion_email_with_custom_recipient(sender, send_method, task_completion, execution_completed):
     """Test send_task_completion_email uses custom recipient from task metadata."""
-    task = Mock(spec=['id', 'name', 'description', 'notifyOn', 'nextRun', 'task_metadata'])
-    task.id = 'task_123'
-    task.name = 'Test Task'
-    task.description = 'Test description'
-    task.notifyOn = 'completion,error'
-    task.nextRun = None
+    task = task_completion
     task.task_metadata = {'recipientEmail': 'custom@example.com'}
+    execution = execution_completed
 
-    execution = Mock(spec=['id', 'status', 'duration', 'output', 'completedAt'])
-    execution.id = 'exec_456'
-    execution.status = 'completed'
-    execution.duration = 1200
-    execution.output = 'Task completed successfully'
-    execution.completedAt = '2026-02-04T10:30:00'
-
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -139,31 +261,16 @@ def test_send_task_completion_email_with_custom_recipient(sender, mock_gmail_ser
     assert message_id == 'msg_12345'
 
     # Verify email was sent to custom recipient
-    call_args = mock_gmail_service.users().messages().send.call_args
-    message_raw = call_args[1]['body']['raw']
-    import base64
-    decoded_message = base64.urlsafe_b64decode(message_raw).decode('utf-8')
+    decoded_message = _decoded_raw(send_method.call_args)
     assert 'To: custom@example.com' in decoded_message
 
 
-def test_send_task_completion_email_falls_back_to_default(sender, mock_gmail_service):
+def test_send_task_completion_email_falls_back_to_default(sender, send_method, task_completion, execution_completed):
     """Test send_task_completion_email falls back to default recipient when no custom recipient."""
-    task = Mock(spec=['id', 'name', 'description', 'notifyOn', 'nextRun', 'task_metadata'])
-    task.id = 'task_123'
-    task.name = 'Test Task'
-    task.description = 'Test description'
-    task.notifyOn = 'completion,error'
-    task.nextRun = None
-    task.task_metadata = None  # No custom recipient
-
-    execution = Mock(spec=['id', 'status', 'duration', 'output', 'completedAt'])
-    execution.id = 'exec_456'
-    execution.status = 'completed'
-    execution.duration = 1200
-    execution.output = 'Task completed successfully'
-    execution.completedAt = '2026-02-04T10:30:00'
+    task = task_completion
+    execution = execution_completed
 
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -172,30 +279,19 @@ def test_send_task_completion_email_falls_back_to_default(sender, mock_gmail_ser
     assert message_id == 'msg_12345'
 
     # Verify email was sent to default recipient (from environment)
-    call_args = mock_gmail_service.users().messages().send.call_args
-    message_raw = call_args[1]['body']['raw']
-    import base64
-    decoded_message = base64.urlsafe_b64decode(message_raw).decode('utf-8')
+    decoded_message = _decoded_raw(send_method.call_args)
     # Should use RECIPIENT_EMAIL from gmail_sender.py (environment or default)
-    from gmail_sender import RECIPIENT_EMAIL
     assert f'To: {RECIPIENT_EMAIL}' in decoded_message
 
 
-def test_send_task_failure_email_with_custom_recipient(sender, mock_gmail_service):
+def test_send_task_failure_email_with_custom_recipient(sender, send_method, task_failure, execution_failed):
     """Test send_task_failure_email uses custom recipient from task metadata."""
-    task = Mock(spec=['id', 'name', 'description', 'task_metadata'])
-    task.id = 'task_123'
-    task.name = 'Failed Task'
-    task.description = 'Test description'
+    task = task_failure
     task.task_metadata = {'recipientEmail': 'alert@example.com'}
-
-    execution = Mock(spec=['id', 'status', 'output', 'completedAt'])
-    execution.id = 'exec_456'
-    execution.status = 'failed'
+    execution = execution_failed
     execution.output = 'Error occurred'
-    execution.completedAt = '2026-02-04T10:30:00'
 
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -204,28 +300,16 @@ def test_send_task_failure_email_with_custom_recipient(sender, mock_gmail_servic
     assert message_id == 'msg_12345'
 
     # Verify email was sent to custom recipient
-    call_args = mock_gmail_service.users().messages().send.call_args
-    message_raw = call_args[1]['body']['raw']
-    import base64
-    decoded_message = base64.urlsafe_b64decode(message_raw).decode('utf-8')
+    decoded_message = _decoded_raw(send_method.call_args)
     assert 'To: alert@example.com' in decoded_message
 
 
-def test_send_task_failure_email(sender, mock_gmail_service):
+def test_send_task_failure_email(sender, send_method, task_failure, execution_failed):
     """Test send_task_failure_email uses correct template."""
-    task = Mock(spec=['id', 'name', 'description', 'task_metadata'])
-    task.id = 'task_123'
-    task.name = 'Failed Task'
-    task.description = 'Test description'
-    task.task_metadata = None
-
-    execution = Mock(spec=['id', 'status', 'output', 'completedAt'])
-    execution.id = 'exec_456'
-    execution.status = 'failed'
-    execution.output = 'Error: Connection timeout'
-    execution.completedAt = '2026-02-04T10:30:00'
+    task = task_failure
+    execution = execution_failed
 
-    mock_gmail_service.users().messages().send().execute.return_value = {
+    send_method.result = {
         'id': 'msg_12345'
     }
 
@@ -234,13 +318,13 @@ def test_send_task_failure_email(sender, mock_gmail_service):
     assert message_id == 'msg_12345'
 
     # Verify email was sent with correct parameters
-    assert mock_gmail_service.users().messages().send.called
-    call_args = mock_gmail_service.users().messages().send.call_args
-    assert call_args[1]['userId'] == 'me'
-    assert 'raw' in call_args[1]['body']
+    assert send_method.called
+    call_args = send_method.call_args
+    assert call_args.kwargs['userId'] == 'me'
+    assert 'raw' in call_args.kwargs['body']
 
 
-def test_singleton_pattern(mock_gmail_service):
+def test_singleton_pattern():
     """Test get_gmail_sender returns same instance."""
     sender1 = get_gmail_sender()
     sender2 = get_gmail_sender()
@@ -248,14 +332,9 @@ def test_singleton_pattern(mock_gmail_service):
     assert sender1 is sender2
 
 
-def test_handles_gmail_api_errors(sender, mock_gmail_service):
+def test_handles_gmail_api_errors(sender, send_method):
     """Test proper error handling for Gmail API failures."""
-    from googleapiclient.errors import HttpError
-
-    mock_gmail_service.users().messages().send().execute.side_effect = HttpError(
-        resp=Mock(status=500),
-        content=b'Server error'
-    )
+    send_method.side_effect = _HTTP_500
 
     with pytest.raises(Exception) as exc_info:
         sender.send_email(
@@ -267,14 +346,11 @@ def test_handles_gmail_api_errors(sender, mock_gmail_service):
     assert 'Gmail API error' in str(exc_info.value)
 
 
-def test_send_daily_digest_with_database(sender, mock_gmail_service):
-    """Test send_daily_digest queries database and sends email."""
-    # Mock database session
-    mock_db = Mock()
-
-    # Mock the query results
-    with patch('gmail_sender.get_daily_digest_data') as mock_query:
-        mock_query.return_value = {
+@pytest.mark.parametrize("patch_target,method_name,payload,msg_id", [
+    pytest.param(
+        'gmail_sender.get_daily_digest_data',
+        'send_daily_digest',
+        {
             'total_tasks': 10,
             'successful': 8,
             'failed': 2,
@@ -282,31 +358,14 @@ def test_send_daily_digest_with_database(sender, mock_gmail_service):
             'upcoming_tasks': [
                 {'name': 'Task 1', 'time': '2026-02-06 08:00:00', 'description': 'Test', 'priority': 'default'}
             ]
-        }
-
-        mock_gmail_service.users().messages().send().execute.return_value = {
-            'id': 'msg_digest_123'
-        }
-
-        message_id = sender.send_daily_digest(mock_db, 'test@example.com', datetime.now())
-
-        # Verify query was called with correct parameters
-        mock_query.assert_called_once()
-        assert mock_query.call_args[0][0] == mock_db
-
-        # Verify email was sent
-        assert message_id == 'msg_digest_123'
-        assert mock_gmail_service.users().messages().send.called
-
-
-def test_send_weekly_summary_with_database(sender, mock_gmail_service):
-    """Test send_weekly_summary queries database and sends email."""
-    # Mock database session
-    mock_db = Mock()
-
-    # Mock the query results
-    with patch('gmail_sender.get_weekly_summary_data') as mock_query:
-        mock_query.return_value = {
+        },
+        'msg_digest_123',
+        id='daily_digest',
+    ),
+    pytest.param(
+        'gmail_sender.get_weekly_summary_data',
+        'send_weekly_summary',
+        {
             'total_executions': 50,
             'success_count': 45,
             'failure_count': 5,
@@ -314,18 +373,30 @@ def test_send_weekly_summary_with_database(sender, mock_gmail_service):
                 {'task': 'Failed Task', 'count': 3}
             ],
             'avg_duration_ms': 2500
-        }
+        },
+        'msg_summary_123',
+        id='weekly_summary',
+    ),
+])
+def test_send_report_with_database(sender, send_method, patch_target, method_name, payload, msg_id):
+    """Test digest/summary senders query the database and send email."""
+    # Mock database session
+    mock_db = Mock()
+
+    # Mock the query results
+    with patch(patch_target) as mock_query:
+        mock_query.return_value = payload
 
-        mock_gmail_service.users().messages().send().execute.return_value = {
-            'id': 'msg_summary_123'
+        send_method.result = {
+            'id': msg_id
         }
 
-        message_id = sender.send_weekly_summary(mock_db, 'test@example.com', datetime.now())
+        message_id = getattr(sender, method_name)(mock_db, 'test@example.com', _FIXED_NOW)
 
         # Verify query was called with correct parameters
         mock_query.assert_called_once()
         assert mock_query.call_args[0][0] == mock_db
 
         # Verify email was sent
-        assert message_id == 'msg_summary_123'
-        assert mock_gmail_service.users().messages().send.called
+        assert message_id == msg_id
+        assert send_method.called
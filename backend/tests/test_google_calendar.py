@@ -1,38 +1,64 @@
 """Tests for Google Calendar sync service."""
 import pytest
+from dataclasses import dataclass
+from typing import Optional
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
+from googleapiclient.errors import HttpError
 from google_calendar import CalendarSync, get_calendar_sync
 
 
-@pytest.fixture
+# Built once; HttpError parses its content on construction
+_HTTP_500 = HttpError(resp=Mock(status=500), content=b'Server error')
+
+
+@pytest.fixture(scope="session")
 def mock_calendar_service():
-    """Mock Calendar API service."""
+    """Mock Calendar API service, shared by the whole session."""
     mock_service = MagicMock()
     return mock_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def calendar_sync(mock_calendar_service):
-    """Create CalendarSync instance with mocked service."""
+    """Create CalendarSync instance with mocked service once per session."""
     with patch('google_calendar.CalendarSync._get_calendar_service', return_value=mock_calendar_service):
         return CalendarSync()
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _primed_calendar_sync(calendar_sync):
+    """Install the session's CalendarSync as the get_calendar_sync() singleton."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('google_calendar._calendar_sync', calendar_sync)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_calendar(mock_calendar_service):
+    """Wipe calls, return values and side effects after each test."""
+    yield
+    mock_calendar_service.reset_mock(return_value=True, side_effect=True)
+
+
+@dataclass(slots=True)
+class _TaskStub:
+    """Plain stand-in for a Task row with the fields CalendarSync reads."""
+    id: str = 'task_123'
+    name: str = 'Daily Backup'
+    description: str = 'Backup database to Drive'
+    command: str = 'backup'
+    args: str = '{}'
+    priority: str = 'default'
+    nextRun: int = int(datetime(2026, 2, 5, 3, 0, 0).timestamp() * 1000)
+    schedule: str = '0 3 * * *'
+    task_metadata: Optional[dict] = None
+
+
 @pytest.fixture
 def sample_task():
     """Create sample task for testing."""
-    task = Mock()
-    task.id = 'task_123'
-    task.name = 'Daily Backup'
-    task.description = 'Backup database to Drive'
-    task.command = 'backup'
-    task.args = '{}'
-    task.priority = 'default'
-    task.nextRun = int(datetime(2026, 2, 5, 3, 0, 0).timestamp() * 1000)
-    task.schedule = '0 3 * * *'
-    task.task_metadata = '{}'
-    return task
+    return _TaskStub()
 
 
 def test_sync_task_creates_calendar_event(calendar_sync, mock_calendar_service, sample_task):
@@ -72,32 +98,29 @@ def test_sync_task_updates_existing_event(calendar_sync, mock_calendar_service,
     assert not mock_calendar_service.events().insert.called
 
 
-def test_sync_task_sets_color_by_priority(calendar_sync, mock_calendar_service, sample_task):
+@pytest.mark.parametrize("priority,expected_color", [
+    ('low', '1'),       # Lavender
+    ('default', '10'),  # Green
+    ('high', '6'),      # Orange
+    ('urgent', '11'),   # Red
+])
+def test_sync_task_sets_color_by_priority(calendar_sync, mock_calendar_service, sample_task, priority, expected_color):
     """Test event color matches task priority."""
-    test_cases = [
-        ('low', '1'),      # Lavender
-        ('default', '10'), # Green
-        ('high', '6'),     # Orange
-        ('urgent', '11')   # Red
-    ]
-
-    for priority, expected_color in test_cases:
-        sample_task.priority = priority
+    sample_task.priority = priority
 
-        mock_calendar_service.events().insert().execute.return_value = {
-            'id': f'event_{priority}'
-        }
+    mock_calendar_service.events().insert().execute.return_value = {
+        'id': f'event_{priority}'
+    }
 
-        calendar_sync.sync_task_to_calendar(sample_task)
+    calendar_sync.sync_task_to_calendar(sample_task)
 
-        call_args = mock_calendar_service.events().insert.call_args
-        event_data = call_args[1]['body']
-        assert event_data['colorId'] == expected_color
+    call_args = mock_calendar_service.events().insert.call_args
+    event_data = call_args[1]['body']
+    assert event_data['colorId'] == expected_color
 
 
 def test_delete_calendar_event(calendar_sync, mock_calendar_service, sample_task):
     """Test delete_calendar_event removes event."""
-    import json
     sample_task.task_metadata = {'calendarEventId': 'event_12345'}
 
     calendar_sync.delete_calendar_event(sample_task)
@@ -120,23 +143,17 @@ def test_get_event_retrieves_from_api(calendar_sync, mock_calendar_service):
     assert event['summary'] == 'Test Event'
 
 
-def test_singleton_pattern(mock_calendar_service):
+def test_singleton_pattern():
     """Test get_calendar_sync returns same instance."""
-    with patch('google_calendar.CalendarSync._get_calendar_service', return_value=mock_calendar_service):
-        sync1 = get_calendar_sync()
-        sync2 = get_calendar_sync()
+    sync1 = get_calendar_sync()
+    sync2 = get_calendar_sync()
 
-        assert sync1 is sync2
+    assert sync1 is sync2
 
 
 def test_handles_calendar_api_errors(calendar_sync, mock_calendar_service, sample_task):
     """Test proper error handling for Calendar API failures."""
-    from googleapiclient.errors import HttpError
-
-    mock_calendar_service.events().insert().execute.side_effect = HttpError(
-        resp=Mock(status=500),
-        content=b'Server error'
-    )
+    mock_calendar_service.events().insert().execute.side_effect = _HTTP_500
 
     with pytest.raises(Exception) as exc_info:
         calendar_sync.sync_task_to_calendar(sample_task)
@@ -6,7 +6,10 @@ All tests should FAIL initially until the implementation is complete.
 """
 
 import os
+import gzip
 import json
+import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -14,6 +17,7 @@ from pathlib import Path
 import pytest
 
 # Import will succeed - this is expected in TDD
+import google_drive
 from google_drive import (
     DriveClient,
     DriveConfig,
@@ -21,10 +25,29 @@ from google_drive import (
     upload_file,
     download_file,
     archive_old_logs,
-    get_drive_link
+    get_drive_link,
+    _compress_log
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_client(monkeypatch):
+    """Start every test without a cached client or credentials so patches apply."""
+    monkeypatch.setattr(google_drive, '_client', None)
+    monkeypatch.setattr(google_drive, '_credentials_cache', {})
+
+
+def _bare_client():
+    """DriveClient with a mocked service, bypassing authentication."""
+    client = DriveClient.__new__(DriveClient)
+    client.service = Mock()
+    client._credentials = Mock()
+    client._local = threading.local()
+    client._folder_lock = threading.Lock()
+    client._folder_cache = {}
+    return client
+
+
 class TestDriveConfig:
     """Test configuration loading for Google Drive client."""
 
@@ -67,12 +90,19 @@ class TestDriveClient:
         client = DriveClient()
 
         assert client.service == mock_service
-        mock_build.assert_called_once_with('drive', 'v3', credentials=mock_creds_obj)
+        mock_build.assert_called_once_with(
+            'drive',
+            'v3',
+            credentials=mock_creds_obj,
+            cache_discovery=False,
+            requestBuilder=client._build_request
+        )
 
     @patch('google_drive.build')
     @patch('google_drive.Credentials.from_authorized_user_file')
+    @patch('os.replace')
     @patch('builtins.open', create=True)
-    def test_refreshes_expired_credentials(self, mock_open, mock_creds, mock_build):
+    def test_refreshes_expired_credentials(self, mock_open, mock_replace, mock_creds, mock_build):
         """Refreshes OAuth token if expired but has refresh token."""
         mock_creds_obj = Mock()
         mock_creds_obj.valid = False
@@ -89,6 +119,25 @@ class TestDriveClient:
         # Should refresh credentials
         mock_creds_obj.refresh.assert_called_once()
 
+        # Should replace the credentials file atomically
+        saved_path = mock_replace.call_args[0][1]
+        mock_replace.assert_called_once_with(saved_path + '.tmp', saved_path)
+
+    @patch('google_drive.build')
+    @patch('google_drive.Credentials.from_authorized_user_file')
+    @patch('os.path.exists', return_value=True)
+    def test_credentials_cached_across_clients(self, mock_exists, mock_creds, mock_build):
+        """Reads the credentials file once and reuses the credentials afterwards."""
+        mock_creds_obj = Mock()
+        mock_creds_obj.valid = True
+        mock_creds.return_value = mock_creds_obj
+
+        DriveClient()
+        DriveClient()
+
+        mock_creds.assert_called_once()
+        assert mock_build.call_args_list[1].kwargs['credentials'] is mock_creds_obj
+
     @patch('google_drive.Credentials.from_authorized_user_file')
     def test_raises_error_when_credentials_invalid(self, mock_creds):
         """Raises error when credentials are invalid and cannot be refreshed."""
@@ -156,6 +205,92 @@ class TestUploadFile:
         mock_client.upload_file.assert_called_once()
 
 
+class TestDriveClientUpload:
+    """Test DriveClient.upload_file against a mocked Drive service."""
+
+    @patch('google_drive.MediaFileUpload')
+    def test_uploads_in_resumable_chunks(self, mock_media, tmp_path):
+        """Uploads in 2 MiB resumable chunks until Drive returns the file."""
+        local_file = tmp_path / 'ai_assistant.log.2026-01-01'
+        local_file.write_text('log line\n')
+
+        client = _bare_client()
+        request = client.service.files.return_value.create.return_value
+        request.next_chunk.side_effect = [(Mock(), None), (None, {'id': 'file123'})]
+
+        file_id = client.upload_file(str(local_file))
+
+        assert file_id == 'file123'
+        assert request.next_chunk.call_count == 2
+        mock_media.assert_called_once_with(
+            str(local_file),
+            mimetype='application/octet-stream',
+            chunksize=2 * 1024 * 1024,
+            resumable=True
+        )
+
+    @patch('google_drive.MediaFileUpload')
+    def test_detects_mime_type_from_extension(self, mock_media, tmp_path):
+        """Detects the MIME type from the file extension when none is given."""
+        local_file = tmp_path / 'report.json'
+        local_file.write_text('{}')
+
+        client = _bare_client()
+        request = client.service.files.return_value.create.return_value
+        request.next_chunk.return_value = (None, {'id': 'file123'})
+
+        client.upload_file(str(local_file))
+
+        assert mock_media.call_args.kwargs['mimetype'] == 'application/json'
+
+
+class TestSharedClient:
+    """Test reuse of one DriveClient across public API calls."""
+
+    @patch('google_drive.DriveClient')
+    def test_reuses_client_across_calls(self, mock_client_class):
+        """Authenticates once and reuses the client for later calls."""
+        mock_client = Mock()
+        mock_client.get_file_link.return_value = 'https://drive.google.com/file/d/file123/view'
+        mock_client_class.return_value = mock_client
+
+        get_drive_link('file123')
+        download_file('file123', '/local/path/file.json')
+
+        mock_client_class.assert_called_once_with()
+        mock_client.download_file.assert_called_once_with('file123', '/local/path/file.json')
+
+    @patch('google_drive.DriveClient')
+    def test_retries_client_creation_after_failure(self, mock_client_class):
+        """Does not cache a failed client creation."""
+        mock_client_class.side_effect = [DriveError("Authentication failed"), Mock()]
+
+        with pytest.raises(DriveError):
+            download_file('file123', '/local/path/file.json')
+        download_file('file123', '/local/path/file.json')
+
+        assert mock_client_class.call_count == 2
+
+
+class TestDriveClientDownload:
+    """Test DriveClient.download_file against a mocked Drive service."""
+
+    @patch('google_drive.MediaIoBaseDownload')
+    def test_downloads_in_2mib_chunks(self, mock_download, tmp_path):
+        """Downloads in 2 MiB chunks, retrying each chunk, until done."""
+        destination = tmp_path / 'file.json'
+        downloader = mock_download.return_value
+        downloader.next_chunk.side_effect = [(Mock(), False), (Mock(), True)]
+
+        client = _bare_client()
+        client.download_file('file123', str(destination))
+
+        client.service.files.return_value.get_media.assert_called_once_with(fileId='file123')
+        assert mock_download.call_args.kwargs['chunksize'] == 2 * 1024 * 1024
+        assert downloader.next_chunk.call_count == 2
+        downloader.next_chunk.assert_called_with(num_retries=3)
+
+
 class TestDownloadFile:
     """Test file download functionality."""
 
@@ -182,29 +317,57 @@ class TestDownloadFile:
             download_file('invalid-id', '/local/path/file.json')
 
 
+def _scandir(*entries):
+    """Stand-in for os.scandir() yielding fake DirEntry objects.
+
+    Args:
+        entries: (filename, mtime) pairs
+    """
+    dir_entries = [
+        SimpleNamespace(
+            name=name,
+            path=f'/path/to/logs/{name}',
+            is_file=lambda: True,
+            stat=Mock(return_value=SimpleNamespace(st_mtime=mtime))
+        )
+        for name, mtime in entries
+    ]
+    scandir = MagicMock()
+    scandir.__enter__.return_value = iter(dir_entries)
+    scandir.entries = dir_entries
+    return scandir
+
+
 class TestArchiveOldLogs:
     """Test log archival functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _skip_compression(self):
+        """The listed log files don't exist, so there is nothing to gzip."""
+        with patch('google_drive._compress_log') as mock_compress:
+            yield mock_compress
+
     @patch('google_drive.DriveClient')
     @patch('os.remove')
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('os.path.exists', return_value=True)
-    @patch('os.path.isfile', return_value=True)
-    @patch('os.path.getmtime')
-    def test_archives_logs_older_than_30_days(self, mock_getmtime, mock_isfile, mock_exists, mock_listdir, mock_remove, mock_client_class):
+    def test_archives_logs_older_than_30_days(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
         """Moves log files older than 30 days to Google Drive."""
         # Mock log files
         now = datetime.now(timezone.utc).timestamp()
         old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
 
-        mock_listdir.return_value = ['ai_assistant.log.2026-01-01', 'ai_assistant.log.2026-02-03', 'ai_assistant.log']
-
         # First file is old, second is recent, third is current log
-        mock_getmtime.side_effect = [old_date, now]
+        today = datetime.now(timezone.utc).date().isoformat()
+        mock_scandir.return_value = _scandir(
+            ('ai_assistant.log.2026-01-01', old_date),
+            (f'ai_assistant.log.{today}', now),
+            ('ai_assistant.log', now)
+        )
 
         mock_client = Mock()
         mock_client.upload_file.return_value = 'file123'
-        mock_client.get_file_link.return_value = 'https://drive.google.com/file/d/file123'
+        mock_client.get_file_links.return_value = {'file123': 'https://drive.google.com/file/d/file123'}
         mock_client_class.return_value = mock_client
 
         archived = archive_old_logs('/path/to/logs')
@@ -212,74 +375,128 @@ class TestArchiveOldLogs:
         # Should archive only the old file
         assert len(archived) == 1
         assert 'ai_assistant.log.2026-01-01' in archived[0]['filename']
+        assert archived[0]['link'] == 'https://drive.google.com/file/d/file123'
         mock_client.upload_file.assert_called_once()
+        mock_client.get_file_links.assert_called_once_with(['file123'])
 
     @patch('google_drive.DriveClient')
     @patch('os.remove')
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('os.path.exists', return_value=True)
-    @patch('os.path.isfile', return_value=True)
-    @patch('os.path.getmtime')
-    def test_deletes_local_logs_after_upload(self, mock_getmtime, mock_isfile, mock_exists, mock_listdir, mock_remove, mock_client_class):
+    def test_deletes_local_logs_after_upload(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
         """Deletes local log files after successful upload to Drive."""
         old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
 
-        mock_listdir.return_value = ['ai_assistant.log.2026-01-01']
-        mock_getmtime.return_value = old_date
+        mock_scandir.return_value = _scandir(('ai_assistant.log.2026-01-01', old_date))
 
         mock_client = Mock()
         mock_client.upload_file.return_value = 'file123'
-        mock_client.get_file_link.return_value = 'https://drive.google.com/file/d/file123'
+        mock_client.get_file_links.return_value = {'file123': 'https://drive.google.com/file/d/file123'}
         mock_client_class.return_value = mock_client
 
         archive_old_logs('/path/to/logs')
 
         # Should delete the file after upload
-        mock_remove.assert_called_once()
+        mock_remove.assert_called_once_with('/path/to/logs/ai_assistant.log.2026-01-01')
 
     @patch('google_drive.DriveClient')
     @patch('os.remove')
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('os.path.exists', return_value=True)
-    @patch('os.path.isfile', return_value=True)
-    @patch('os.path.getmtime')
-    def test_organizes_logs_by_year_month(self, mock_getmtime, mock_isfile, mock_exists, mock_listdir, mock_remove, mock_client_class):
+    def test_organizes_logs_by_year_month(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
         """Organizes archived logs in Drive by year and month folders."""
         old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
 
-        mock_listdir.return_value = ['ai_assistant.log.2026-01-15']
-        mock_getmtime.return_value = old_date
+        mock_scandir.return_value = _scandir(('ai_assistant.log.2026-01-15', old_date))
 
         mock_client = Mock()
         mock_client.upload_file.return_value = 'file123'
-        mock_client.get_file_link.return_value = 'https://drive.google.com/file/d/file123'
+        mock_client.get_file_links.return_value = {'file123': 'https://drive.google.com/file/d/file123'}
         mock_client_class.return_value = mock_client
 
         archive_old_logs('/path/to/logs')
 
         # Should upload to year/month folder structure
-        call_args = mock_client.upload_file.call_args
-        folder_path = call_args[0][1]  # Second argument
-        assert '2026' in folder_path
-        assert '01' in folder_path
+        mock_client.get_folder_id.assert_called_once_with('AI Assistant Drive/logs/2026/01')
+        mock_client.upload_file.assert_called_once()
+        assert mock_client.upload_file.call_args.kwargs['folder_id'] == mock_client.get_folder_id.return_value
 
     @patch('google_drive.DriveClient')
     @patch('os.remove')
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('os.path.exists', return_value=True)
-    @patch('os.path.isfile', return_value=True)
-    @patch('os.path.getmtime')
-    def test_continues_on_upload_failure(self, mock_getmtime, mock_isfile, mock_exists, mock_listdir, mock_remove, mock_client_class):
+    def test_uploads_compressed_artifact(self, mock_exists, mock_scandir, mock_remove, mock_client_class, _skip_compression):
+        """Uploads a gzipped copy of the log and deletes the original."""
+        old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
+
+        mock_scandir.return_value = _scandir(('ai_assistant.log.2026-01-15', old_date))
+
+        mock_client = Mock()
+        mock_client.upload_file.return_value = 'file123'
+        mock_client.get_file_links.return_value = {}
+        mock_client_class.return_value = mock_client
+
+        archive_old_logs('/path/to/logs')
+
+        uploaded_path = mock_client.upload_file.call_args.args[0]
+        assert os.path.basename(uploaded_path) == 'ai_assistant.log.2026-01-15.gz'
+        assert mock_client.upload_file.call_args.kwargs['mime_type'] == 'application/gzip'
+        _skip_compression.assert_called_once_with('/path/to/logs/ai_assistant.log.2026-01-15', uploaded_path)
+        mock_remove.assert_called_once_with('/path/to/logs/ai_assistant.log.2026-01-15')
+
+    @patch('google_drive.DriveClient')
+    @patch('os.remove')
+    @patch('os.scandir')
+    @patch('os.path.exists', return_value=True)
+    def test_resolves_each_month_folder_once(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
+        """Resolves each year/month folder once and uploads every file in it by ID."""
+        old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
+
+        mock_scandir.return_value = _scandir(
+            ('ai_assistant.log.2026-01-01', old_date),
+            ('ai_assistant.log.2025-12-31', old_date),
+            ('ai_assistant.log.2026-01-02', old_date)
+        )
+
+        mock_client = Mock()
+        mock_client.get_folder_id.side_effect = lambda folder_path: f'id:{folder_path[-7:]}'
+        mock_client.upload_file.return_value = 'file123'
+        mock_client.get_file_links.return_value = {}
+        mock_client_class.return_value = mock_client
+
+        archive_old_logs('/path/to/logs')
+
+        assert mock_client.get_folder_id.call_args_list == [
+            call('AI Assistant Drive/logs/2025/12'),
+            call('AI Assistant Drive/logs/2026/01')
+        ]
+        uploads = {
+            os.path.basename(c.args[0]).split('.')[2]: c.kwargs['folder_id']
+            for c in mock_client.upload_file.call_args_list
+        }
+        assert uploads == {
+            '2025-12-31': 'id:2025/12',
+            '2026-01-01': 'id:2026/01',
+            '2026-01-02': 'id:2026/01'
+        }
+
+    @patch('google_drive.DriveClient')
+    @patch('os.remove')
+    @patch('os.scandir')
+    @patch('os.path.exists', return_value=True)
+    def test_continues_on_upload_failure(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
         """Continues archiving other files if one upload fails."""
         old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
 
-        mock_listdir.return_value = ['ai_assistant.log.2026-01-01', 'ai_assistant.log.2026-01-02']
-        mock_getmtime.return_value = old_date
+        mock_scandir.return_value = _scandir(
+            ('ai_assistant.log.2026-01-01', old_date),
+            ('ai_assistant.log.2026-01-02', old_date)
+        )
 
         mock_client = Mock()
         # First upload fails, second succeeds
         mock_client.upload_file.side_effect = [Exception("Upload failed"), 'file123']
-        mock_client.get_file_link.return_value = 'https://drive.google.com/file/d/file123'
+        mock_client.get_file_links.return_value = {'file123': 'https://drive.google.com/file/d/file123'}
         mock_client_class.return_value = mock_client
 
         archived = archive_old_logs('/path/to/logs')
@@ -289,6 +506,84 @@ class TestArchiveOldLogs:
         # Should not delete files that failed to upload
         mock_remove.assert_called_once()
 
+    @patch('google_drive.DriveClient')
+    @patch('os.remove')
+    @patch('os.scandir')
+    @patch('os.path.exists', return_value=True)
+    def test_skips_stat_when_date_in_filename(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
+        """Decides age from the file name date and only stats files near the cutoff."""
+        now = datetime.now(timezone.utc)
+        near_cutoff = (now - timedelta(days=30)).date().isoformat()
+        tomorrow = (now + timedelta(days=1)).date().isoformat()
+
+        mock_scandir.return_value = _scandir(
+            ('ai_assistant.log.2020-01-01', now.timestamp()),
+            (f'ai_assistant.log.{tomorrow}', 0),
+            (f'ai_assistant.log.{near_cutoff}', (now - timedelta(days=31)).timestamp())
+        )
+
+        mock_client = Mock()
+        mock_client.upload_file.return_value = 'file123'
+        mock_client.get_file_links.return_value = {}
+        mock_client_class.return_value = mock_client
+
+        archived = archive_old_logs('/path/to/logs')
+
+        old, recent, ambiguous = mock_scandir.return_value.entries
+        old.stat.assert_not_called()
+        recent.stat.assert_not_called()
+        ambiguous.stat.assert_called_once()
+        assert sorted(info['filename'] for info in archived) == [
+            'ai_assistant.log.2020-01-01',
+            f'ai_assistant.log.{near_cutoff}'
+        ]
+
+    @patch('google_drive.DriveClient')
+    @patch('os.remove')
+    @patch('os.scandir')
+    @patch('os.path.exists', return_value=True)
+    def test_uploads_run_concurrently(self, mock_exists, mock_scandir, mock_remove, mock_client_class):
+        """Runs up to max_workers uploads at the same time."""
+        old_date = (datetime.now(timezone.utc) - timedelta(days=31)).timestamp()
+
+        mock_scandir.return_value = _scandir(
+            ('ai_assistant.log.2026-01-01', old_date),
+            ('ai_assistant.log.2026-01-02', old_date)
+        )
+
+        # Each upload blocks until both are in flight; sequential uploads break the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(file_path, **kwargs):
+            barrier.wait()
+            return os.path.basename(file_path)
+
+        mock_client = Mock()
+        mock_client.upload_file.side_effect = upload
+        mock_client.get_file_links.return_value = {}
+        mock_client_class.return_value = mock_client
+
+        archived = archive_old_logs('/path/to/logs', max_workers=2)
+
+        assert len(archived) == 2
+        assert mock_remove.call_count == 2
+
+
+class TestCompressLog:
+    """Test gzip compression of archived logs."""
+
+    def test_round_trips_log_contents(self, tmp_path):
+        """Compressed output decompresses to the original log lines."""
+        source = tmp_path / 'ai_assistant.log.2026-01-15'
+        content = ''.join(json.dumps({'message': f'line {i}', 'level': 'INFO'}) + '\n' for i in range(1000))
+        source.write_text(content)
+        destination = tmp_path / 'ai_assistant.log.2026-01-15.gz'
+
+        _compress_log(str(source), str(destination))
+
+        assert gzip.decompress(destination.read_bytes()).decode() == content
+        assert destination.stat().st_size < source.stat().st_size / 5
+
 
 class TestGetDriveLink:
     """Test Drive link generation."""
@@ -318,14 +613,44 @@ class TestGetDriveLink:
         mock_client.get_file_link.assert_called_once_with('file123', True)
 
 
+class TestGetFileLinks:
+    """Test batched link lookups on DriveClient."""
+
+    @patch('google_drive.DriveClient.__init__', return_value=None)
+    def test_uses_batched_metadata_requests(self, mock_init):
+        """Fetches links through Drive batch requests of at most BATCH_SIZE calls."""
+        client = _bare_client()
+        batches = []
+
+        def new_batch(callback):
+            batch = Mock()
+            batch.added = []
+            batch.add.side_effect = lambda request, request_id: batch.added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(file_id, {'webViewLink': f'https://drive.google.com/file/d/{file_id}'}, None)
+                for file_id in batch.added
+            ]
+            batches.append(batch)
+            return batch
+
+        client.service.new_batch_http_request.side_effect = new_batch
+        file_ids = [f'file{i}' for i in range(30)]
+
+        links = client.get_file_links(file_ids)
+
+        assert [len(batch.added) for batch in batches] == [25, 5]
+        assert all(len(batch.added) <= DriveClient.BATCH_SIZE for batch in batches)
+        assert links['file29'] == 'https://drive.google.com/file/d/file29'
+        assert len(links) == 30
+
+
 class TestDriveClientHelpers:
     """Test helper methods of DriveClient."""
 
     @patch('google_drive.DriveClient.__init__', return_value=None)
     def test_finds_or_creates_folder(self, mock_init):
         """Finds existing folder or creates new one."""
-        client = DriveClient.__new__(DriveClient)
-        client.service = Mock()
+        client = _bare_client()
 
         # Mock folder search - folder exists
         mock_search = Mock()
@@ -336,11 +661,14 @@ class TestDriveClientHelpers:
 
         assert folder_id == 'folder123'
 
+        # A second lookup of the same folder is answered from the cache
+        assert client._find_or_create_folder('TestFolder', parent_id=None) == 'folder123'
+        assert client.service.files.return_value.list.call_count == 1
+
     @patch('google_drive.DriveClient.__init__', return_value=None)
     def test_creates_folder_when_not_found(self, mock_init):
         """Creates new folder when it doesn't exist."""
-        client = DriveClient.__new__(DriveClient)
-        client.service = Mock()
+        client = _bare_client()
 
         # Mock folder search - no results
         mock_search = Mock()
@@ -360,8 +688,7 @@ class TestDriveClientHelpers:
     @patch('google_drive.DriveClient.__init__', return_value=None)
     def test_creates_nested_folder_path(self, mock_init):
         """Creates nested folder structure from path string."""
-        client = DriveClient.__new__(DriveClient)
-        client.service = Mock()
+        client = _bare_client()
 
         # Mock folder searches and creations
         mock_search = Mock()
@@ -379,5 +706,68 @@ class TestDriveClientHelpers:
 
         folder_id = client._create_folder_path('AI Assistant Drive/logs/2026')
 
-        # Should create all three folders
+        # Should look every segment up in one request and create all three folders
+        assert client.service.files.return_value.list.call_count == 1
         assert client.service.files.return_value.create.call_count == 3
+        assert folder_id == 'folder3'
+
+    @patch('google_drive.DriveClient.__init__', return_value=None)
+    def test_creates_only_missing_tail_of_folder_path(self, mock_init):
+        """Reuses existing folders in the path and creates only the missing ones."""
+        client = _bare_client()
+
+        # Root and logs exist; a same-named '2026' under another parent must not match
+        mock_search = Mock()
+        mock_search.execute.return_value = {'files': [
+            {'id': 'root-folder', 'name': 'AI Assistant Drive', 'parents': ['drive-root']},
+            {'id': 'logs-folder', 'name': 'logs', 'parents': ['root-folder']},
+            {'id': 'other-2026', 'name': '2026', 'parents': ['elsewhere']},
+        ]}
+        client.service.files.return_value.list.return_value = mock_search
+
+        mock_create = Mock()
+        mock_create.execute.side_effect = [{'id': 'year-folder'}, {'id': 'month-folder'}]
+        client.service.files.return_value.create.return_value = mock_create
+
+        folder_id = client._create_folder_path('AI Assistant Drive/logs/2026/02')
+
+        assert folder_id == 'month-folder'
+        assert client.service.files.return_value.list.call_count == 1
+        created = client.service.files.return_value.create.call_args_list
+        assert [c.kwargs['body']['name'] for c in created] == ['2026', '02']
+        assert created[0].kwargs['body']['parents'] == ['logs-folder']
+
+        # Resolving the same path again needs no further requests
+        assert client._create_folder_path('AI Assistant Drive/logs/2026/02') == 'month-folder'
+        assert client.service.files.return_value.list.call_count == 1
+        assert client.service.files.return_value.create.call_count == 2
+
+    @patch('google_drive.DriveClient.__init__', return_value=None)
+    def test_folder_lookup_reads_every_result_page(self, mock_init):
+        """Folders on later result pages are found instead of recreated."""
+        client = _bare_client()
+
+        mock_search = Mock()
+        mock_search.execute.side_effect = [
+            {'files': [{'id': 'root-folder', 'name': 'AI Assistant Drive', 'parents': ['drive-root']}],
+             'nextPageToken': 'page-2'},
+            {'files': [{'id': 'logs-folder', 'name': 'logs', 'parents': ['root-folder']}]},
+        ]
+        client.service.files.return_value.list.return_value = mock_search
+
+        folder_id = client._create_folder_path('AI Assistant Drive/logs')
+
+        assert folder_id == 'logs-folder'
+        calls = client.service.files.return_value.list.call_args_list
+        assert len(calls) == 2
+        assert 'pageToken' not in calls[0].kwargs
+        assert calls[1].kwargs['pageToken'] == 'page-2'
+        assert not client.service.files.return_value.create.called
+
+    @patch('google_drive.DriveClient.__init__', return_value=None)
+    def test_empty_folder_path_returns_none(self, mock_init):
+        """A path with no segments resolves to None without any requests."""
+        client = _bare_client()
+
+        assert client._create_folder_path('/') is None
+        assert not client.service.files.return_value.list.called
@@ -192,6 +192,56 @@ class TestJSONLogFormatter:
         assert parsed.get("execution_id") is None
         assert parsed.get("metadata") is None or parsed.get("metadata") == {}
 
+    def test_escapes_message_without_context_fields(self):
+        """Records without context fields should still be valid, fully escaped JSON."""
+        from logger import JSONLogFormatter
+
+        formatter = JSONLogFormatter()
+        message = 'Quote " backslash \\ newline \n tab \t unicode é ✅'
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg=message,
+            args=(),
+            exc_info=None
+        )
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["message"] == message
+        assert parsed["level"] == "INFO"
+        assert parsed["task_id"] is None
+        assert parsed["execution_id"] is None
+        assert parsed["metadata"] == {}
+        assert datetime.fromisoformat(parsed["timestamp"]).timestamp() == pytest.approx(record.created)
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        """Formatter should produce the same fields when orjson is unavailable."""
+        import logger
+        from logger import JSONLogFormatter
+
+        formatter = JSONLogFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.metadata = {"attempt": 2}
+
+        fast = json.loads(formatter.format(record))
+        monkeypatch.setattr(logger, "orjson", None)
+        fallback = json.loads(formatter.format(record))
+
+        fast.pop("timestamp")
+        fallback.pop("timestamp")
+        assert fast == fallback
+
 
 class TestLoggerSetup:
     """Test logger configuration and setup."""
@@ -232,6 +282,17 @@ class TestLoggerSetup:
             log_files = list(Path(tmpdir).glob("*.log"))
             assert len(log_files) > 0
 
+    def test_logger_only_enqueues_records(self):
+        """Logger should hand records to a queue instead of writing them itself."""
+        from logger import setup_logger, get_file_handlers
+        from logging.handlers import QueueHandler
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = setup_logger(log_dir=tmpdir)
+
+            assert all(isinstance(h, QueueHandler) for h in logger.handlers)
+            assert len(get_file_handlers(logger)) > 0
+
     def test_log_level_set_correctly(self):
         """Logger should respect specified log level."""
         from logger import setup_logger
@@ -241,13 +302,70 @@ class TestLoggerSetup:
 
             assert logger.level == logging.WARNING
 
+    def test_batches_writes_under_load(self):
+        """Queued records should reach the file in a few large writes, not one per record."""
+        from unittest.mock import Mock
+        from logger import setup_logger, get_file_handlers, flush_logger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = setup_logger(log_dir=tmpdir)
+            handler = get_file_handlers(logger)[0]
+            handler.stream = Mock(wraps=handler.stream)
+
+            for i in range(1000):
+                logger.info("Record %d", i)
+            flush_logger(logger)
+
+            assert handler.stream.write.call_count < 20
+            with open(handler.baseFilename) as f:
+                assert len(f.readlines()) == 1000
+
+    def test_file_stream_buffers_64kib(self):
+        """File handler should hold up to 64 KiB of output until it is flushed."""
+        from logger import setup_logger, get_file_handlers
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = setup_logger(log_dir=tmpdir)
+            handler = get_file_handlers(logger)[0]
+
+            # Larger than the default 8 KiB buffer, smaller than 64 KiB
+            handler.acquire()
+            try:
+                handler.stream.write("x" * 20000)
+                assert os.path.getsize(handler.baseFilename) == 0
+
+                handler.flush()
+                assert os.path.getsize(handler.baseFilename) == 20000
+            finally:
+                handler.release()
+
+    def test_fsync_called_on_interval_not_per_record(self):
+        """Log file should be fsynced on a timer, not once per record."""
+        from unittest.mock import patch
+        from logger import setup_logger, flush_logger
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch("os.fsync") as mock_fsync:
+            logger = setup_logger(log_dir=tmpdir, fsync_interval_ms=200)
+
+            for i in range(1000):
+                logger.info("Record %d", i)
+            flush_logger(logger)
+
+            assert mock_fsync.call_count < 10
+
+            # The idle listener syncs the last batch once the interval passes
+            deadline = time.monotonic() + 5
+            while mock_fsync.call_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert mock_fsync.call_count >= 1
+
 
 class TestLogRotation:
     """Test daily log rotation functionality."""
 
     def test_uses_timed_rotating_handler(self):
         """Logger should use TimedRotatingFileHandler for daily rotation."""
-        from logger import setup_logger
+        from logger import setup_logger, get_file_handlers
         from logging.handlers import TimedRotatingFileHandler
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -255,21 +373,21 @@ class TestLogRotation:
 
             # Should have at least one TimedRotatingFileHandler
             rotating_handlers = [
-                h for h in logger.handlers
+                h for h in get_file_handlers(logger)
                 if isinstance(h, TimedRotatingFileHandler)
             ]
             assert len(rotating_handlers) > 0
 
     def test_rotation_configured_for_midnight(self):
         """TimedRotatingFileHandler should rotate at midnight."""
-        from logger import setup_logger
+        from logger import setup_logger, get_file_handlers
         from logging.handlers import TimedRotatingFileHandler
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
 
             rotating_handler = next(
-                h for h in logger.handlers
+                h for h in get_file_handlers(logger)
                 if isinstance(h, TimedRotatingFileHandler)
             )
 
@@ -280,14 +398,14 @@ class TestLogRotation:
 
     def test_backup_count_set_to_30(self):
         """TimedRotatingFileHandler should keep 30 days of logs."""
-        from logger import setup_logger
+        from logger import setup_logger, get_file_handlers
         from logging.handlers import TimedRotatingFileHandler
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
 
             rotating_handler = next(
-                h for h in logger.handlers
+                h for h in get_file_handlers(logger)
                 if isinstance(h, TimedRotatingFileHandler)
             )
 
@@ -299,12 +417,14 @@ class TestStructuredLogging:
 
     def test_log_with_task_id(self):
         """Should log with task_id in structured format."""
-        from logger import setup_logger
+        from logger import setup_logger, flush_logger
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
             logger.info("Task started", extra={"task_id": "task-789"})
 
+            flush_logger(logger)
+
             # Read log file
             log_files = list(Path(tmpdir).glob("*.log"))
             with open(log_files[0]) as f:
@@ -316,12 +436,14 @@ class TestStructuredLogging:
 
     def test_log_with_execution_id(self):
         """Should log with execution_id in structured format."""
-        from logger import setup_logger
+        from logger import setup_logger, flush_logger
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
             logger.info("Execution started", extra={"execution_id": "exec-999"})
 
+            flush_logger(logger)
+
             # Read log file
             log_files = list(Path(tmpdir).glob("*.log"))
             with open(log_files[0]) as f:
@@ -332,13 +454,15 @@ class TestStructuredLogging:
 
     def test_log_with_metadata(self):
         """Should log with metadata dict in structured format."""
-        from logger import setup_logger
+        from logger import setup_logger, flush_logger
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
             metadata = {"endpoint": "/api/tasks", "status_code": 200}
             logger.info("API request", extra={"metadata": metadata})
 
+            flush_logger(logger)
+
             # Read log file
             log_files = list(Path(tmpdir).glob("*.log"))
             with open(log_files[0]) as f:
@@ -350,7 +474,7 @@ class TestStructuredLogging:
 
     def test_log_with_all_fields(self):
         """Should log with all structured fields."""
-        from logger import setup_logger
+        from logger import setup_logger, flush_logger
 
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = setup_logger(log_dir=tmpdir)
@@ -363,6 +487,8 @@ class TestStructuredLogging:
                 }
             )
 
+            flush_logger(logger)
+
             # Read log file
             log_files = list(Path(tmpdir).glob("*.log"))
             with open(log_files[0]) as f:
@@ -377,6 +503,48 @@ class TestStructuredLogging:
             assert parsed["metadata"]["duration_ms"] == 30000
 
 
+class TestCtxLogger:
+    """Test the context-field logger adapter."""
+
+    def test_logs_context_fields_as_keywords(self):
+        """Context keyword arguments should end up as structured fields."""
+        from logger import setup_logger, flush_logger, CtxLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = CtxLogger(setup_logger(log_dir=tmpdir))
+            logger.info("Task started", task_id="task-1", execution_id="exec-1", metadata={"attempt": 1})
+            flush_logger(logger.logger)
+
+            with open(next(Path(tmpdir).glob("*.log"))) as f:
+                parsed = json.loads(f.readline())
+
+            assert parsed["task_id"] == "task-1"
+            assert parsed["execution_id"] == "exec-1"
+            assert parsed["metadata"] == {"attempt": 1}
+
+    def test_skips_extra_build_when_disabled(self):
+        """Lazy metadata should not be built for levels below the threshold."""
+        from unittest.mock import Mock
+        from logger import setup_logger, flush_logger, CtxLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = CtxLogger(setup_logger(log_dir=tmpdir, level=logging.WARNING))
+            build_metadata = Mock(return_value={"rows": 3})
+
+            logger.info("Filtered out", metadata=build_metadata)
+            build_metadata.assert_not_called()
+
+            logger.warning("Logged", metadata=build_metadata)
+            build_metadata.assert_called_once()
+            flush_logger(logger.logger)
+
+            with open(next(Path(tmpdir).glob("*.log"))) as f:
+                lines = f.readlines()
+
+            assert len(lines) == 1
+            assert json.loads(lines[0])["metadata"] == {"rows": 3}
+
+
 class TestDefaultLoggerFunction:
     """Test get_logger() helper function."""
 
@@ -389,16 +557,45 @@ class TestDefaultLoggerFunction:
         assert isinstance(logger, logging.Logger)
         assert len(logger.handlers) > 0
 
+    def test_get_logger_reuses_running_listener(self):
+        """Repeated get_logger() calls should not restart the background listener."""
+        from logger import get_logger, _listeners
+
+        logger = get_logger()
+        listener = _listeners[logger.name]
+        handlers = list(logger.handlers)
+
+        assert get_logger() is logger
+        assert _listeners[logger.name] is listener
+        assert logger.handlers == handlers
+
+    def test_setup_logger_with_new_arguments_reconfigures(self):
+        """setup_logger() should replace the listener only when its arguments change."""
+        from logger import setup_logger, _listeners, _stop_listener
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = setup_logger(log_dir=tmpdir, logger_name="reconfigured")
+            listener = _listeners["reconfigured"]
+
+            assert setup_logger(log_dir=tmpdir, logger_name="reconfigured") is logger
+            assert _listeners["reconfigured"] is listener
+
+            setup_logger(log_dir=tmpdir, logger_name="reconfigured", level=logging.WARNING)
+            assert _listeners["reconfigured"] is not listener
+            assert logger.level == logging.WARNING
+
+            _stop_listener("reconfigured")
+
     def test_get_logger_uses_ai_workspace_logs_directory(self):
         """get_logger() should default to ai-workspace/logs directory."""
-        from logger import get_logger
+        from logger import get_logger, get_file_handlers
 
         logger = get_logger()
 
         # Check that handlers point to ai-workspace/logs
         from logging.handlers import TimedRotatingFileHandler
         rotating_handlers = [
-            h for h in logger.handlers
+            h for h in get_file_handlers(logger)
             if isinstance(h, TimedRotatingFileHandler)
         ]
 
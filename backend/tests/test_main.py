@@ -11,32 +11,56 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 
+@pytest.fixture(scope="module")
+def app():
+    """Import the FastAPI app once for the whole module."""
+    from main import app
+    return app
+
+
+@pytest.fixture(scope="module")
+def client(app):
+    """One TestClient shared by every test in the module.
+
+    Entered as a context manager so the app's lifespan startup and
+    shutdown run once around the module.
+    """
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def ws(client):
+    """One /ws connection, welcome message already drained, shared by the module."""
+    with client.websocket_connect("/ws") as websocket:
+        websocket.receive_json()
+        yield websocket
+
+
 # Test 1: FastAPI app can be created and runs
-def test_app_creation():
+def test_app_creation(app):
     """Test that FastAPI app can be imported and created."""
-    from main import app
-    assert app is not None
-    assert hasattr(app, 'title')
+    assert app.title == "AI Assistant Backend"
 
 
 # Test 2: Health endpoint returns 200 OK
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test /health endpoint returns service status."""
-    from main import app
-    client = TestClient(app)
 
     response = client.get("/health")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["status"] in ["healthy", "degraded"]
-    assert "service" in data
     assert data["service"] == "ai-assistant-backend"
     # Verify status matches database and scheduler state
     if data["database"] == "connected" and data["scheduler"] == "running":
@@ -46,23 +70,18 @@ def test_health_endpoint():
 
 
 # Test 3: Health endpoint returns database connection status
-def test_health_endpoint_includes_database_status():
+def test_health_endpoint_includes_database_status(client):
     """Test /health endpoint checks database connectivity."""
-    from main import app
-    client = TestClient(app)
 
     response = client.get("/health")
-    data = response.json()
+    data = orjson.loads(response.content)
 
-    assert "database" in data
     assert data["database"] in ["connected", "disconnected"]
 
 
 # Test 4: CORS middleware is configured
-def test_cors_middleware_configured():
+def test_cors_middleware_configured(client):
     """Test that CORS middleware allows frontend origin."""
-    from main import app
-    client = TestClient(app)
 
     response = client.options(
         "/health",
@@ -76,13 +95,34 @@ def test_cors_middleware_configured():
     assert "access-control-allow-origin" in response.headers
 
 
+def test_cors_preflight_response_is_cached():
+    """Test that identical preflights reuse one prebuilt response."""
+    from starlette.datastructures import Headers
+    from main import CachedPreflightCORSMiddleware
+
+    middleware = CachedPreflightCORSMiddleware(
+        app=None,
+        allow_origins=["http://localhost:3000"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    headers = Headers({
+        "origin": "http://localhost:3000",
+        "access-control-request-method": "GET",
+    })
+
+    first = middleware.preflight_response(headers)
+    second = middleware.preflight_response(headers)
+
+    assert first is second
+    assert first.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert middleware._cached_preflight.cache_info().hits == 1
+
+
 # Test 5: WebSocket endpoint exists
 @pytest.mark.asyncio
-async def test_websocket_endpoint_exists():
+async def test_websocket_endpoint_exists(client):
     """Test that /ws WebSocket endpoint exists and accepts connections."""
-    from main import app
-
-    client = TestClient(app)
     with client.websocket_connect("/ws") as websocket:
         # Connection should establish without error
         assert websocket is not None
@@ -90,15 +130,12 @@ async def test_websocket_endpoint_exists():
 
 # Test 6: WebSocket accepts connections (auth will be added in future PR)
 @pytest.mark.asyncio
-async def test_websocket_accepts_connections():
+async def test_websocket_accepts_connections(client):
     """Test that WebSocket endpoint accepts connections.
 
     Note: Authentication will be implemented in a future iteration.
     For Phase 2, we're establishing the basic WebSocket infrastructure.
     """
-    from main import app
-
-    client = TestClient(app)
 
     # Connection should succeed
     with client.websocket_connect("/ws") as websocket:
@@ -108,15 +145,12 @@ async def test_websocket_accepts_connections():
 
 # Test 7: WebSocket sends welcome message on connection
 @pytest.mark.asyncio
-async def test_websocket_sends_welcome_message():
+async def test_websocket_sends_welcome_message(client):
     """Test that WebSocket sends welcome message upon successful connection.
 
     Note: Authentication will be implemented in a future iteration.
     For Phase 2, we're establishing the basic WebSocket infrastructure.
     """
-    from main import app
-
-    client = TestClient(app)
     with client.websocket_connect("/ws") as websocket:
         message = websocket.receive_json()
 
@@ -127,30 +161,21 @@ async def test_websocket_sends_welcome_message():
 
 # Test 8: WebSocket handles ping/pong
 @pytest.mark.asyncio
-async def test_websocket_ping_pong():
+async def test_websocket_ping_pong(ws):
     """Test WebSocket responds to ping with pong."""
-    from main import app
-
-    client = TestClient(app)
-    with client.websocket_connect("/ws") as websocket:
-        # Skip welcome message
-        websocket.receive_json()
+    # Send ping
+    ws.send_json({"type": "ping"})
 
-        # Send ping
-        websocket.send_json({"type": "ping"})
-
-        # Receive pong
-        response = websocket.receive_json()
-        assert response["type"] == "pong"
+    # Receive pong
+    response = ws.receive_json()
+    assert response["type"] == "pong"
 
 
 # Test 9: WebSocket can broadcast to multiple clients
 @pytest.mark.asyncio
-async def test_websocket_broadcast_to_multiple_clients():
+async def test_websocket_broadcast_to_multiple_clients(client):
     """Test ConnectionManager can broadcast messages to multiple clients."""
-    from main import app, manager
-
-    client = TestClient(app)
+    from main import manager
 
     # Connect two clients
     with client.websocket_connect("/ws") as ws1:
@@ -166,70 +191,57 @@ async def test_websocket_broadcast_to_multiple_clients():
 
 # Test 10: WebSocket echoes non-ping messages
 @pytest.mark.asyncio
-async def test_websocket_echo_message():
+async def test_websocket_echo_message(ws):
     """Test that WebSocket echoes back non-ping messages."""
-    from main import app
+    # Send a custom message
+    test_message = {"type": "test", "data": {"content": "hello"}}
+    ws.send_json(test_message)
 
-    client = TestClient(app)
-    with client.websocket_connect("/ws") as websocket:
-        # Skip welcome message
-        websocket.receive_json()
-
-        # Send a custom message
-        test_message = {"type": "test", "data": {"content": "hello"}}
-        websocket.send_json(test_message)
-
-        # Receive echo response
-        response = websocket.receive_json()
-        assert response["type"] == "echo"
-        assert response["data"] == test_message
-        assert "timestamp" in response
+    # Receive echo response
+    response = ws.receive_json()
+    assert response["type"] == "echo"
+    assert response["data"] == test_message
+    assert "timestamp" in response
 
 
 # Test 11: Root endpoint returns API info
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint returns API information."""
-    from main import app
-    client = TestClient(app)
 
     response = client.get("/")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert "message" in data
     assert "version" in data
     assert "websocket" in data
 
 
 # Test 12: Log viewer endpoint exists
-def test_logs_endpoint_exists():
+def test_logs_endpoint_exists(client):
     """Test /api/logs endpoint exists and returns logs."""
-    from main import app
-    client = TestClient(app)
 
     response = client.get("/api/logs")
 
     assert response.status_code == 200
-    data = response.json()
-    assert "logs" in data
-    assert isinstance(data["logs"], list)
+    # Structural check on the raw body; no need to parse the whole payload
+    assert response.content.startswith(b'{"logs":[')
 
 
 # Test 13: Log viewer returns JSON log entries
-def test_logs_endpoint_returns_json_entries():
+def test_logs_endpoint_returns_json_entries(client):
     """Test /api/logs endpoint returns parsed JSON log entries."""
-    from main import app
-    from logger import get_logger
+    from logger import get_logger, flush_logger
 
     # Write some test logs
     logger = get_logger()
     logger.info("Test log entry", extra={"task_id": "test-123"})
+    flush_logger(logger)
 
-    client = TestClient(app)
     response = client.get("/api/logs")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert len(data["logs"]) > 0
 
     # Check structure of log entry
@@ -240,35 +252,33 @@ def test_logs_endpoint_returns_json_entries():
 
 
 # Test 14: Log viewer supports limit parameter
-def test_logs_endpoint_supports_limit():
+def test_logs_endpoint_supports_limit(client):
     """Test /api/logs endpoint supports limit query parameter."""
-    from main import app
-    client = TestClient(app)
 
     response = client.get("/api/logs?limit=5")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert len(data["logs"]) <= 5
 
 
 # Test 15: Log viewer returns most recent logs first
-def test_logs_endpoint_returns_recent_first():
+def test_logs_endpoint_returns_recent_first(client):
     """Test /api/logs endpoint returns logs in reverse chronological order."""
-    from main import app
-    from logger import get_logger
+    from logger import get_logger, flush_logger
 
     # Write logs with different timestamps
     logger = get_logger()
     logger.info("First log")
     logger.info("Second log")
     logger.info("Third log")
+    # Records are written by a background listener; wait for them to land
+    flush_logger(logger)
 
-    client = TestClient(app)
     response = client.get("/api/logs?limit=3")
 
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if len(data["logs"]) >= 2:
         # Most recent should be first
@@ -278,69 +288,60 @@ def test_logs_endpoint_returns_recent_first():
 
 
 # Test 16: Log viewer handles invalid log entries gracefully
-def test_logs_endpoint_handles_invalid_entries():
+def test_logs_endpoint_handles_invalid_entries(client):
     """Test /api/logs endpoint skips invalid JSON lines."""
-    from main import app
     import os
     from pathlib import Path
 
     # This test verifies the endpoint doesn't crash on malformed logs
     # The implementation should skip invalid lines
-    client = TestClient(app)
     response = client.get("/api/logs")
 
     # Should not error even if there are invalid lines
     assert response.status_code == 200
 
 
-# Test 17: Calendar sync endpoint creates Calendar event
-def test_sync_task_endpoint_creates_calendar_event():
-    """Test POST /api/calendar/sync creates Calendar event."""
-    from unittest.mock import Mock, patch
+@pytest.fixture(scope="module")
+def _calendar_mocks():
+    """Calendar sync, task and metadata-update mocks shared by the module."""
+    return SimpleNamespace(sync=Mock(), task=Mock(), update_metadata=Mock())
 
-    with patch('main.get_calendar_sync') as mock_get_sync:
-        mock_sync = Mock()
-        mock_sync.sync_task_to_calendar.return_value = 'event_12345'
-        mock_get_sync.return_value = mock_sync
 
-        with patch('main.get_task_from_db') as mock_get_task:
-            mock_task = Mock()
-            mock_task.id = 'task_123'
-            mock_task.name = 'Test Task'
-            mock_get_task.return_value = mock_task
+@pytest.fixture
+def mocked_calendar(monkeypatch, _calendar_mocks):
+    """Route main's calendar helpers to the shared mocks, reset for this test."""
+    for mock in vars(_calendar_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("main.get_calendar_sync", lambda: _calendar_mocks.sync)
+    monkeypatch.setattr("main.get_task_from_db", lambda *args, **kwargs: _calendar_mocks.task)
+    monkeypatch.setattr("main.update_task_metadata", _calendar_mocks.update_metadata)
+    return _calendar_mocks
 
-            with patch('main.update_task_metadata') as mock_update:
-                from main import app
-                client = TestClient(app)
 
-                response = client.post(
-                    '/api/calendar/sync',
-                    json={'taskId': 'task_123'}
-                )
+# Test 17: Calendar sync endpoint creates Calendar event
+def test_sync_task_endpoint_creates_calendar_event(client, mocked_calendar):
+    """Test POST /api/calendar/sync creates Calendar event."""
+    mock_sync = mocked_calendar.sync
+    mock_sync.sync_task_to_calendar.return_value = 'event_12345'
+    mocked_calendar.task.id = 'task_123'
+    mocked_calendar.task.name = 'Test Task'
+
+    response = client.post(
+        '/api/calendar/sync',
+        json={'taskId': 'task_123'}
+    )
 
-                assert response.status_code == 200
-                assert response.json()['event_id'] == 'event_12345'
-                assert mock_sync.sync_task_to_calendar.called
+    assert response.status_code == 200
+    assert orjson.loads(response.content)['event_id'] == 'event_12345'
+    assert mock_sync.sync_task_to_calendar.called
 
 
 # Test 18: Delete task event endpoint
-def test_delete_task_event_endpoint():
+def test_delete_task_event_endpoint(client, mocked_calendar):
     """Test DELETE /api/calendar/sync/{task_id} removes event."""
-    from unittest.mock import Mock, patch
-
-    with patch('main.get_calendar_sync') as mock_get_sync:
-        mock_sync = Mock()
-        mock_get_sync.return_value = mock_sync
+    mocked_calendar.task.id = 'task_123'
 
-        with patch('main.get_task_from_db') as mock_get_task:
-            mock_task = Mock()
-            mock_task.id = 'task_123'
-            mock_get_task.return_value = mock_task
+    response = client.delete('/api/calendar/sync/task_123')
 
-            from main import app
-            client = TestClient(app)
-
-            response = client.delete('/api/calendar/sync/task_123')
-
-            assert response.status_code == 200
-            assert mock_sync.delete_calendar_event.called
+    assert response.status_code == 200
+    assert mocked_calendar.sync.delete_calendar_event.called
@@ -6,135 +6,106 @@ from mcp_task_server import (
     delete_task_tool,
     get_task_executions_tool
 )
-from database import SessionLocal
-from models import Task, User
-from datetime import datetime, timezone
+from models import Task
+import time
+
+
+@pytest.fixture
+def db(db_session, shared_user):
+    """Session for one test; everything it writes is rolled back afterwards."""
+    return db_session
+
+
+def _task(user_id, name, schedule="0 9 * * *", **kwargs):
+    now_ms = time.time_ns() // 1_000_000
+    return Task(userId=user_id, name=name, schedule=schedule, command="echo", args="",
+                createdAt=now_ms, updatedAt=now_ms, **kwargs)
 
 
 @pytest.mark.asyncio
-async def test_create_task_tool():
+async def test_create_task_tool(db):
     """Test create_task MCP tool."""
-    db = SessionLocal()
-
-    try:
-        # Call tool
-        result = await create_task_tool(db, {
-            "name": "Test MCP Task",
-            "description": "Created via MCP",
-            "schedule": "0 9 * * *",
-            "command": "echo",
-            "args": "test",
-            "priority": "default",
-            "enabled": True
-        })
-
-        # Check result
-        assert len(result) == 1
-        assert "Success" in result[0].text or "created" in result[0].text.lower()
-
-        # Verify in database
-        task = db.query(Task).filter_by(name="Test MCP Task").first()
-        assert task is not None
-        assert task.schedule == "0 9 * * *"
-        assert task.command == "echo"
-
-    finally:
-        # Cleanup
-        db.query(Task).filter_by(name="Test MCP Task").delete()
-        db.commit()
-        db.close()
+    # Call tool
+    result = await create_task_tool(db, {
+        "name": "Test MCP Task",
+        "description": "Created via MCP",
+        "schedule": "0 9 * * *",
+        "command": "echo",
+        "args": "test",
+        "priority": "default",
+        "enabled": True
+    })
+
+    # Check result
+    assert len(result) == 1
+    assert "Success" in result[0].text or "created" in result[0].text.lower()
+
+    # Verify in database
+    task = db.query(Task).filter_by(name="Test MCP Task").first()
+    assert task is not None
+    assert task.schedule == "0 9 * * *"
+    assert task.command == "echo"
 
 
 @pytest.mark.asyncio
-async def test_list_tasks_tool():
+async def test_list_tasks_tool(db, shared_user):
     """Test list_tasks MCP tool."""
-    db = SessionLocal()
+    # Create test tasks in one INSERT, bypassing the ORM unit of work
+    now_ms = time.time_ns() // 1_000_000
+    db.bulk_insert_mappings(Task, [
+        dict(userId=shared_user, name="Task 1", schedule="0 9 * * *", command="echo", args="",
+             enabled=True, createdAt=now_ms, updatedAt=now_ms),
+        dict(userId=shared_user, name="Task 2", schedule="0 10 * * *", command="echo", args="",
+             enabled=False, createdAt=now_ms, updatedAt=now_ms),
+    ])
+    db.commit()
 
-    try:
-        # Create test tasks
-        user = db.query(User).first()
-        db.add(Task(userId=user.id, name="Task 1", schedule="0 9 * * *", command="echo", args="", enabled=True,
-                    createdAt=int(datetime.now(timezone.utc).timestamp() * 1000),
-                    updatedAt=int(datetime.now(timezone.utc).timestamp() * 1000)))
-        db.add(Task(userId=user.id, name="Task 2", schedule="0 10 * * *", command="echo", args="", enabled=False,
-                    createdAt=int(datetime.now(timezone.utc).timestamp() * 1000),
-                    updatedAt=int(datetime.now(timezone.utc).timestamp() * 1000)))
-        db.commit()
+    # Test list all
+    result = await list_tasks_tool(db, {"filter": "all"})
+    assert "Task 1" in result[0].text or "Found" in result[0].text
 
-        # Test list all
-        result = await list_tasks_tool(db, {"filter": "all"})
-        assert "Task 1" in result[0].text or "Found" in result[0].text
-
-        # Test list enabled only
-        result = await list_tasks_tool(db, {"filter": "enabled"})
-        assert "Task 1" in result[0].text
-
-    finally:
-        db.query(Task).filter(Task.name.in_(["Task 1", "Task 2"])).delete()
-        db.commit()
-        db.close()
+    # Test list enabled only
+    result = await list_tasks_tool(db, {"filter": "enabled"})
+    assert "Task 1" in result[0].text
 
 
 @pytest.mark.asyncio
-async def test_update_task_tool():
+async def test_update_task_tool(db, shared_user):
     """Test update_task MCP tool."""
-    db = SessionLocal()
-
-    try:
-        # Create test task
-        user = db.query(User).first()
-        task = Task(userId=user.id, name="Update Test", schedule="0 9 * * *", command="echo", args="",
-                    createdAt=int(datetime.now(timezone.utc).timestamp() * 1000),
-                    updatedAt=int(datetime.now(timezone.utc).timestamp() * 1000))
-        db.add(task)
-        db.commit()
-        db.refresh(task)
-
-        # Update task
-        result = await update_task_tool(db, {
-            "task_id": task.id,
-            "updates": {"schedule": "0 10 * * *", "description": "Updated"}
-        })
+    # Create test task
+    task = _task(shared_user, "Update Test")
+    db.add(task)
+    db.commit()
+    db.refresh(task)
 
-        assert "Success" in result[0].text
+    # Update task
+    result = await update_task_tool(db, {
+        "task_id": task.id,
+        "updates": {"schedule": "0 10 * * *", "description": "Updated"}
+    })
 
-        # Verify update
-        db.refresh(task)
-        assert task.schedule == "0 10 * * *"
-        assert task.description == "Updated"
+    assert "Success" in result[0].text
 
-    finally:
-        db.query(Task).filter_by(name="Update Test").delete()
-        db.commit()
-        db.close()
+    # Verify update
+    db.refresh(task)
+    assert task.schedule == "0 10 * * *"
+    assert task.description == "Updated"
 
 
 @pytest.mark.asyncio
-async def test_delete_task_tool():
+async def test_delete_task_tool(db, shared_user):
     """Test delete_task MCP tool."""
-    db = SessionLocal()
-
-    try:
-        # Create test task
-        user = db.query(User).first()
-        task = Task(userId=user.id, name="Delete Test", schedule="0 9 * * *", command="echo", args="",
-                    createdAt=int(datetime.now(timezone.utc).timestamp() * 1000),
-                    updatedAt=int(datetime.now(timezone.utc).timestamp() * 1000))
-        db.add(task)
-        db.commit()
-        db.refresh(task)
-        task_id = task.id
-
-        # Delete task
-        result = await delete_task_tool(db, {"task_id": task_id})
-        assert "Success" in result[0].text or "Deleted" in result[0].text
-
-        # Verify deletion
-        deleted_task = db.query(Task).filter_by(id=task_id).first()
-        assert deleted_task is None
-
-    finally:
-        # Cleanup (just in case)
-        db.query(Task).filter_by(name="Delete Test").delete()
-        db.commit()
-        db.close()
+    # Create test task
+    task = _task(shared_user, "Delete Test")
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    task_id = task.id
+
+    # Delete task
+    result = await delete_task_tool(db, {"task_id": task_id})
+    assert "Success" in result[0].text or "Deleted" in result[0].text
+
+    # Verify deletion
+    deleted_task = db.query(Task).filter_by(id=task_id).first()
+    assert deleted_task is None
@@ -7,34 +7,16 @@ and cascade deletes work as expected.
 
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session, selectinload
 
-from database import Base
 from models import (
     User, Session as DBSession, Task, TaskExecution,
     ActivityLog, Notification, AiMemory
 )
 
 
-# Test database setup
-@pytest.fixture(scope="function")
-def engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture(scope="function")
-def db_session(engine):
-    """Create a new database session for a test."""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+# The session-scoped engine and rolled-back db_session come from conftest.py:
+# the schema is created once and each test runs inside its own transaction.
 
 
 @pytest.fixture
@@ -108,7 +90,7 @@ def test_create_user(db_session: Session):
     db_session.commit()
 
     # Verify user was created
-    retrieved_user = db_session.query(User).filter_by(id="user-123").first()
+    retrieved_user = db_session.get(User, "user-123")
     assert retrieved_user is not None
     assert retrieved_user.email == "user@example.com"
     assert retrieved_user.name == "John Doe"
@@ -146,7 +128,7 @@ def test_create_session(db_session: Session, sample_user: User):
     db_session.commit()
 
     # Verify session was created
-    retrieved_session = db_session.query(DBSession).filter_by(id="session-123").first()
+    retrieved_session = db_session.get(DBSession, "session-123")
     assert retrieved_session is not None
     assert retrieved_session.sessionToken == "token-abc-xyz"
     assert retrieved_session.userId == sample_user.id
@@ -167,8 +149,9 @@ def test_session_cascade_delete(db_session: Session, sample_user: User):
     db_session.delete(sample_user)
     db_session.commit()
 
-    # Verify session was also deleted
-    retrieved_session = db_session.query(DBSession).filter_by(id="session-123").first()
+    # Verify session was also deleted (expire first so get() goes to the database)
+    db_session.expire_all()
+    retrieved_session = db_session.get(DBSession, "session-123")
     assert retrieved_session is None
 
 
@@ -194,7 +177,7 @@ def test_create_task(db_session: Session, sample_user: User):
     db_session.commit()
 
     # Verify task was created
-    retrieved_task = db_session.query(Task).filter_by(id="task-123").first()
+    retrieved_task = db_session.get(Task, "task-123")
     assert retrieved_task is not None
     assert retrieved_task.name == "Daily Backup"
     assert retrieved_task.command == "backup"
@@ -240,7 +223,8 @@ def test_task_cascade_delete(db_session: Session, sample_user: User):
     db_session.commit()
 
     # Verify task was also deleted
-    retrieved_task = db_session.query(Task).filter_by(id="task-123").first()
+    db_session.expire_all()
+    retrieved_task = db_session.get(Task, "task-123")
     assert retrieved_task is None
 
 
@@ -260,7 +244,7 @@ def test_create_task_execution(db_session: Session, sample_task: Task):
     db_session.commit()
 
     # Verify execution was created
-    retrieved_execution = db_session.query(TaskExecution).filter_by(id="exec-123").first()
+    retrieved_execution = db_session.get(TaskExecution, "exec-123")
     assert retrieved_execution is not None
     assert retrieved_execution.status == "running"
     assert retrieved_execution.taskId == sample_task.id
@@ -276,7 +260,7 @@ def test_task_execution_complete(db_session: Session, sample_task: Task):
         startedAt=int(start_time.timestamp() * 1000)
     )
     db_session.add(execution)
-    db_session.commit()
+    db_session.flush()
 
     # Complete the execution
     complete_time = datetime.utcnow()
@@ -287,7 +271,7 @@ def test_task_execution_complete(db_session: Session, sample_task: Task):
     db_session.commit()
 
     # Verify updates
-    retrieved_execution = db_session.query(TaskExecution).filter_by(id="exec-123").first()
+    retrieved_execution = db_session.get(TaskExecution, "exec-123")
     assert retrieved_execution.status == "completed"
     assert retrieved_execution.completedAt is not None
     assert retrieved_execution.output == "Task completed successfully"
@@ -310,7 +294,8 @@ def test_task_execution_cascade_delete(db_session: Session, sample_task: Task):
     db_session.commit()
 
     # Verify execution was also deleted
-    retrieved_execution = db_session.query(TaskExecution).filter_by(id="exec-123").first()
+    db_session.expire_all()
+    retrieved_execution = db_session.get(TaskExecution, "exec-123")
     assert retrieved_execution is None
 
 
@@ -331,7 +316,7 @@ def test_create_activity_log(db_session: Session, sample_execution: TaskExecutio
     db_session.commit()
 
     # Verify log was created
-    retrieved_log = db_session.query(ActivityLog).filter_by(id="log-123").first()
+    retrieved_log = db_session.get(ActivityLog, "log-123")
     assert retrieved_log is not None
     assert retrieved_log.type == "task_start"
     assert retrieved_log.message == "Task started successfully"
@@ -348,7 +333,7 @@ def test_activity_log_without_execution(db_session: Session):
     db_session.commit()
 
     # Verify log was created
-    retrieved_log = db_session.query(ActivityLog).filter_by(id="log-standalone").first()
+    retrieved_log = db_session.get(ActivityLog, "log-standalone")
     assert retrieved_log is not None
     assert retrieved_log.executionId is None
 
@@ -362,14 +347,15 @@ def test_activity_log_cascade_delete(db_session: Session, sample_execution: Task
         message="Task completed"
     )
     db_session.add(log)
-    db_session.commit()
+    db_session.flush()
 
     # Delete execution
     db_session.delete(sample_execution)
     db_session.commit()
 
     # Verify log was also deleted
-    retrieved_log = db_session.query(ActivityLog).filter_by(id="log-123").first()
+    db_session.expire_all()
+    retrieved_log = db_session.get(ActivityLog, "log-123")
     assert retrieved_log is None
 
 
@@ -390,7 +376,7 @@ def test_create_notification(db_session: Session):
     db_session.commit()
 
     # Verify notification was created
-    retrieved_notif = db_session.query(Notification).filter_by(id="notif-123").first()
+    retrieved_notif = db_session.get(Notification, "notif-123")
     assert retrieved_notif is not None
     assert retrieved_notif.title == "Task Completed"
     assert retrieved_notif.priority == "default"
@@ -405,7 +391,7 @@ def test_notification_read_status(db_session: Session):
         message="Test notification"
     )
     db_session.add(notification)
-    db_session.commit()
+    db_session.flush()
 
     # Mark as read
     read_time = datetime.utcnow()
@@ -413,7 +399,7 @@ def test_notification_read_status(db_session: Session):
     db_session.commit()
 
     # Verify read status
-    retrieved_notif = db_session.query(Notification).filter_by(id="notif-123").first()
+    retrieved_notif = db_session.get(Notification, "notif-123")
     assert retrieved_notif.readAt is not None
 
 
@@ -433,7 +419,7 @@ def test_create_ai_memory(db_session: Session):
     db_session.commit()
 
     # Verify memory was created
-    retrieved_memory = db_session.query(AiMemory).filter_by(id="mem-123").first()
+    retrieved_memory = db_session.get(AiMemory, "mem-123")
     assert retrieved_memory is not None
     assert retrieved_memory.key == "user_preference_theme"
     assert retrieved_memory.category == "preference"
@@ -461,7 +447,7 @@ def test_ai_memory_update(db_session: Session):
         category="context"
     )
     db_session.add(memory)
-    db_session.commit()
+    db_session.flush()
 
     # Update memory
     original_updated_at = memory.updatedAt
@@ -470,7 +456,7 @@ def test_ai_memory_update(db_session: Session):
     db_session.refresh(memory)
 
     # Verify update
-    retrieved_memory = db_session.query(AiMemory).filter_by(id="mem-123").first()
+    retrieved_memory = db_session.get(AiMemory, "mem-123")
     assert retrieved_memory.value == '{"topic": "Machine Learning"}'
     assert retrieved_memory.updatedAt >= original_updated_at
 
@@ -479,118 +465,91 @@ def test_ai_memory_update(db_session: Session):
 # Relationship Tests
 # ============================================================================
 
+def _bulk_insert(db_session: Session, model, rows):
+    """Insert plain-dict rows in one executemany, skipping ORM instance bookkeeping."""
+    db_session.bulk_insert_mappings(model, rows)
+    db_session.commit()
+    # Make later relationship loads and queries see the new rows
+    db_session.expire_all()
+
+
 def test_user_tasks_relationship(db_session: Session, sample_user: User):
     """Test the relationship between User and Tasks."""
     # Create multiple tasks for the user
-    task1 = Task(
-        id="task-1",
-        userId=sample_user.id,
-        name="Task 1",
-        command="test",
-        args="{}",
-        schedule="* * * * *"
-    )
-    task2 = Task(
-        id="task-2",
-        userId=sample_user.id,
-        name="Task 2",
-        command="test",
-        args="{}",
-        schedule="* * * * *"
+    _bulk_insert(db_session, Task, [
+        dict(id="task-1", userId=sample_user.id, name="Task 1", command="test", args="{}", schedule="* * * * *"),
+        dict(id="task-2", userId=sample_user.id, name="Task 2", command="test", args="{}", schedule="* * * * *"),
+    ])
+
+    # Verify relationship, loading the tasks with the user in one extra SELECT
+    user = (
+        db_session.query(User)
+        .options(selectinload(User.tasks))
+        .filter_by(id=sample_user.id)
+        .one()
     )
-    db_session.add_all([task1, task2])
-    db_session.commit()
-
-    # Verify relationship
-    db_session.refresh(sample_user)
-    assert len(sample_user.tasks) == 2
-    assert task1 in sample_user.tasks
-    assert task2 in sample_user.tasks
+    assert {task.id for task in user.tasks} == {"task-1", "task-2"}
 
 
 def test_task_executions_relationship(db_session: Session, sample_task: Task):
     """Test the relationship between Task and TaskExecutions."""
     # Create multiple executions for the task
-    exec1 = TaskExecution(
-        id="exec-1",
-        taskId=sample_task.id,
-        status="completed",
-        startedAt=datetime.utcnow()
-    )
-    exec2 = TaskExecution(
-        id="exec-2",
-        taskId=sample_task.id,
-        status="completed",
-        startedAt=datetime.utcnow()
-    )
-    db_session.add_all([exec1, exec2])
-    db_session.commit()
+    started = datetime.utcnow()
+    _bulk_insert(db_session, TaskExecution, [
+        dict(id="exec-1", taskId=sample_task.id, status="completed", startedAt=started),
+        dict(id="exec-2", taskId=sample_task.id, status="completed", startedAt=started),
+    ])
 
     # Verify relationship
-    db_session.refresh(sample_task)
-    assert len(sample_task.executions) == 2
+    task = (
+        db_session.query(Task)
+        .options(selectinload(Task.executions))
+        .filter_by(id=sample_task.id)
+        .one()
+    )
+    assert len(task.executions) == 2
 
 
 def test_execution_logs_relationship(db_session: Session, sample_execution: TaskExecution):
     """Test the relationship between TaskExecution and ActivityLogs."""
     # Create multiple logs for the execution
-    log1 = ActivityLog(
-        id="log-1",
-        executionId=sample_execution.id,
-        type="task_start",
-        message="Started"
-    )
-    log2 = ActivityLog(
-        id="log-2",
-        executionId=sample_execution.id,
-        type="task_complete",
-        message="Completed"
-    )
-    db_session.add_all([log1, log2])
-    db_session.commit()
+    _bulk_insert(db_session, ActivityLog, [
+        dict(id="log-1", executionId=sample_execution.id, type="task_start", message="Started"),
+        dict(id="log-2", executionId=sample_execution.id, type="task_complete", message="Completed"),
+    ])
 
     # Verify relationship
-    db_session.refresh(sample_execution)
-    assert len(sample_execution.logs) == 2
+    execution = (
+        db_session.query(TaskExecution)
+        .options(selectinload(TaskExecution.logs))
+        .filter_by(id=sample_execution.id)
+        .one()
+    )
+    assert len(execution.logs) == 2
 
 
 def test_full_cascade_delete_chain(db_session: Session, sample_user: User):
     """Test cascade delete through the entire chain: User -> Task -> Execution -> Log."""
-    # Create a full chain
-    task = Task(
-        id="task-cascade",
-        userId=sample_user.id,
-        name="Cascade Test",
-        command="test",
-        args="{}",
-        schedule="* * * * *"
-    )
-    db_session.add(task)
-    db_session.commit()
-
-    execution = TaskExecution(
-        id="exec-cascade",
-        taskId=task.id,
-        status="completed",
-        startedAt=datetime.utcnow()
-    )
-    db_session.add(execution)
-    db_session.commit()
-
-    log = ActivityLog(
-        id="log-cascade",
-        executionId=execution.id,
-        type="test",
-        message="Test log"
-    )
-    db_session.add(log)
-    db_session.commit()
+    # Create a full chain in a single transaction
+    db_session.bulk_insert_mappings(Task, [dict(
+        id="task-cascade", userId=sample_user.id, name="Cascade Test",
+        command="test", args="{}", schedule="* * * * *"
+    )])
+    db_session.bulk_insert_mappings(TaskExecution, [dict(
+        id="exec-cascade", taskId="task-cascade", status="completed", startedAt=datetime.utcnow()
+    )])
+    db_session.bulk_insert_mappings(ActivityLog, [dict(
+        id="log-cascade", executionId="exec-cascade", type="test", message="Test log"
+    )])
+    db_session.commit()
+    db_session.expire_all()
 
     # Delete the user (should cascade delete everything)
     db_session.delete(sample_user)
     db_session.commit()
 
     # Verify everything was deleted
-    assert db_session.query(Task).filter_by(id="task-cascade").first() is None
-    assert db_session.query(TaskExecution).filter_by(id="exec-cascade").first() is None
-    assert db_session.query(ActivityLog).filter_by(id="log-cascade").first() is None
+    db_session.expire_all()
+    assert db_session.get(Task, "task-cascade") is None
+    assert db_session.get(TaskExecution, "exec-cascade") is None
+    assert db_session.get(ActivityLog, "log-cascade") is None
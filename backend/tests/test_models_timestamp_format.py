@@ -5,6 +5,7 @@ This ensures compatibility with Prisma, which expects INTEGER format for DateTim
 """
 import pytest
 import time
+from functools import lru_cache
 from sqlalchemy import inspect, Integer, Text
 from models import (
     User,
@@ -18,57 +19,41 @@ from models import (
 from database import engine
 
 
-def get_column_type(model, column_name):
-    """Get the SQLAlchemy type of a column in a model."""
-    mapper = inspect(model)
-    column = mapper.columns[column_name]
-    return column.type
-
-
-def test_user_timestamps_are_integer():
-    """User model timestamps should be INTEGER type."""
-    assert isinstance(get_column_type(User, 'createdAt'), Integer), \
-        "User.createdAt should be INTEGER type"
-    assert isinstance(get_column_type(User, 'updatedAt'), Integer), \
-        "User.updatedAt should be INTEGER type"
-
-
-def test_task_execution_timestamps_are_integer():
-    """TaskExecution model timestamps should be INTEGER type."""
-    assert isinstance(get_column_type(TaskExecution, 'startedAt'), Integer), \
-        "TaskExecution.startedAt should be INTEGER type"
-    assert isinstance(get_column_type(TaskExecution, 'completedAt'), Integer), \
-        "TaskExecution.completedAt should be INTEGER type"
-
-
-def test_activity_log_created_at_is_integer():
-    """ActivityLog model createdAt should be INTEGER type."""
-    assert isinstance(get_column_type(ActivityLog, 'createdAt'), Integer), \
-        "ActivityLog.createdAt should be INTEGER type"
+@lru_cache(maxsize=None)
+def _cols(model):
+    """Column types of a model keyed by attribute name, inspected once per model."""
+    return {key: column.type for key, column in inspect(model).columns.items()}
 
 
-def test_notification_timestamps_are_integer():
-    """Notification model timestamps should be INTEGER type."""
-    assert isinstance(get_column_type(Notification, 'sentAt'), Integer), \
-        "Notification.sentAt should be INTEGER type"
-    assert isinstance(get_column_type(Notification, 'readAt'), Integer), \
-        "Notification.readAt should be INTEGER type"
-
-
-def test_ai_memory_timestamps_are_integer():
-    """AiMemory model timestamps should be INTEGER type."""
-    assert isinstance(get_column_type(AiMemory, 'createdAt'), Integer), \
-        "AiMemory.createdAt should be INTEGER type"
-    assert isinstance(get_column_type(AiMemory, 'updatedAt'), Integer), \
-        "AiMemory.updatedAt should be INTEGER type"
-
-
-def test_digest_settings_timestamps_are_integer():
-    """DigestSettings model timestamps should be INTEGER type."""
-    assert isinstance(get_column_type(DigestSettings, 'createdAt'), Integer), \
-        "DigestSettings.createdAt should be INTEGER type"
-    assert isinstance(get_column_type(DigestSettings, 'updatedAt'), Integer), \
-        "DigestSettings.updatedAt should be INTEGER type"
+def get_column_type(model, column_name):
+    """Get the SQLAlchemy type of a column in a model."""
+    return _cols(model)[column_name]
+
+
+_TIMESTAMP_COLUMNS = [
+    (User, 'createdAt'),
+    (User, 'updatedAt'),
+    (TaskExecution, 'startedAt'),
+    (TaskExecution, 'completedAt'),
+    (ActivityLog, 'createdAt'),
+    (Notification, 'sentAt'),
+    (Notification, 'readAt'),
+    (AiMemory, 'createdAt'),
+    (AiMemory, 'updatedAt'),
+    (DigestSettings, 'createdAt'),
+    (DigestSettings, 'updatedAt'),
+]
+
+
+@pytest.mark.parametrize(
+    "model, column_name",
+    _TIMESTAMP_COLUMNS,
+    ids=[f"{model.__name__}.{column_name}" for model, column_name in _TIMESTAMP_COLUMNS],
+)
+def test_timestamp_is_integer(model, column_name):
+    """Model timestamp columns should be INTEGER type."""
+    assert isinstance(get_column_type(model, column_name), Integer), \
+        f"{model.__name__}.{column_name} should be INTEGER type"
 
 
 def test_timestamp_defaults_generate_unix_milliseconds(db_session):
@@ -0,0 +1,77 @@
+-- CreateTable
+CREATE TABLE "DailyRollup" (
+    "date" TEXT NOT NULL,
+    "taskId" TEXT NOT NULL,
+    "successful" INTEGER NOT NULL DEFAULT 0,
+    "failed" INTEGER NOT NULL DEFAULT 0,
+    "totalDuration" BIGINT NOT NULL DEFAULT 0,
+    "durationCount" INTEGER NOT NULL DEFAULT 0,
+    "total" INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY ("date", "taskId")
+);
+
+-- Backfill
+INSERT INTO "DailyRollup" (date, taskId, successful, failed, totalDuration, durationCount, total)
+SELECT date(startedAt / 1000, 'unixepoch'), taskId,
+       SUM(status = 'completed'), SUM(status = 'failed'),
+       COALESCE(SUM(duration), 0), COUNT(duration), COUNT(*)
+FROM "TaskExecution"
+WHERE typeof(startedAt) = 'integer'
+GROUP BY 1, 2;
+
+-- CreateTrigger
+CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_insert"
+AFTER INSERT ON "TaskExecution"
+BEGIN
+INSERT INTO "DailyRollup" (date, taskId, successful, failed, totalDuration, durationCount, total)
+SELECT date(NEW.startedAt / 1000, 'unixepoch'), NEW.taskId,
+       NEW.status = 'completed', NEW.status = 'failed',
+       COALESCE(NEW.duration, 0), NEW.duration IS NOT NULL, 1
+WHERE typeof(NEW.startedAt) = 'integer'
+ON CONFLICT (date, taskId) DO UPDATE SET
+    successful = successful + excluded.successful,
+    failed = failed + excluded.failed,
+    totalDuration = totalDuration + excluded.totalDuration,
+    durationCount = durationCount + excluded.durationCount,
+    total = total + excluded.total;
+END;
+
+-- CreateTrigger
+CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_update"
+AFTER UPDATE OF taskId, status, startedAt, duration ON "TaskExecution"
+BEGIN
+UPDATE "DailyRollup" SET
+    successful = successful - (OLD.status = 'completed'),
+    failed = failed - (OLD.status = 'failed'),
+    totalDuration = totalDuration - COALESCE(OLD.duration, 0),
+    durationCount = durationCount - (OLD.duration IS NOT NULL),
+    total = total - 1
+WHERE typeof(OLD.startedAt) = 'integer' AND date = date(OLD.startedAt / 1000, 'unixepoch') AND taskId = OLD.taskId;
+DELETE FROM "DailyRollup" WHERE typeof(OLD.startedAt) = 'integer' AND date = date(OLD.startedAt / 1000, 'unixepoch') AND taskId = OLD.taskId AND total <= 0;
+INSERT INTO "DailyRollup" (date, taskId, successful, failed, totalDuration, durationCount, total)
+SELECT date(NEW.startedAt / 1000, 'unixepoch'), NEW.taskId,
+       NEW.status = 'completed', NEW.status = 'failed',
+       COALESCE(NEW.duration, 0), NEW.duration IS NOT NULL, 1
+WHERE typeof(NEW.startedAt) = 'integer'
+ON CONFLICT (date, taskId) DO UPDATE SET
+    successful = successful + excluded.successful,
+    failed = failed + excluded.failed,
+    totalDuration = totalDuration + excluded.totalDuration,
+    durationCount = durationCount + excluded.durationCount,
+    total = total + excluded.total;
+END;
+
+-- CreateTrigger
+CREATE TRIGGER IF NOT EXISTS "TaskExecution_rollup_delete"
+AFTER DELETE ON "TaskExecution"
+BEGIN
+UPDATE "DailyRollup" SET
+    successful = successful - (OLD.status = 'completed'),
+    failed = failed - (OLD.status = 'failed'),
+    totalDuration = totalDuration - COALESCE(OLD.duration, 0),
+    durationCount = durationCount - (OLD.duration IS NOT NULL),
+    total = total - 1
+WHERE typeof(OLD.startedAt) = 'integer' AND date = date(OLD.startedAt / 1000, 'unixepoch') AND taskId = OLD.taskId;
+DELETE FROM "DailyRollup" WHERE typeof(OLD.startedAt) = 'integer' AND date = date(OLD.startedAt / 1000, 'unixepoch') AND taskId = OLD.taskId AND total <= 0;
+END;
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "ix_taskexec_started_status" ON "TaskExecution"("startedAt", "status");